@@ -30,10 +30,12 @@ hiddenimports = [
     'PyQt6.QtWidgets',
     'PyQt6.QtCore',
     'PyQt6.QtGui',
+    'PyQt6.QtNetwork',
     'cv2',
     'numpy',
     'PIL',
     'pyautogui',
+    'mss',
     'pytesseract',
     'pynput',
     'pynput.keyboard',
@@ -6,17 +6,35 @@ from typing import Optional
 import pyautogui
 from models.task import ActionType
 
+try:
+    import pyperclip
+except ImportError:  # only needed for non-ASCII text input
+    pyperclip = None
+
 
 # Safety settings
 pyautogui.FAILSAFE = True  # Move mouse to corner to abort
-pyautogui.PAUSE = 0.1  # Small pause between actions
+# No implicit sleep after every pyautogui call; execute() and _type_text()
+# wait explicitly where the target app needs time (pre_delay, type_delay,
+# before Enter, after paste)
+pyautogui.PAUSE = 0
 
 _IS_WINDOWS = platform.system() == "Windows"
 
+# Ctrl+V on Windows, Cmd+V on Mac
+_PASTE_HOTKEY = ("ctrl", "v") if _IS_WINDOWS else ("command", "v")
+
 
 class ActionExecutor:
     """Executes mouse/keyboard actions at specified screen coordinates."""
 
+    # ActionType -> pyautogui function taking (x, y)
+    _ACTIONS = {
+        ActionType.CLICK: pyautogui.click,
+        ActionType.DOUBLE_CLICK: pyautogui.doubleClick,
+        ActionType.RIGHT_CLICK: pyautogui.rightClick,
+    }
+
     def __init__(self):
         self.last_action_time = 0.0
 
@@ -46,12 +64,9 @@ class ActionExecutor:
         if pre_delay > 0:
             time.sleep(pre_delay)
 
-        if action == ActionType.CLICK:
-            pyautogui.click(x, y)
-        elif action == ActionType.DOUBLE_CLICK:
-            pyautogui.doubleClick(x, y)
-        elif action == ActionType.RIGHT_CLICK:
-            pyautogui.rightClick(x, y)
+        mouse_action = self._ACTIONS.get(action)
+        if mouse_action is not None:
+            mouse_action(x, y)
 
         # Type text after click (if configured)
         if type_text:
@@ -68,29 +83,20 @@ class ActionExecutor:
         Type text using clipboard paste for full Unicode/Korean support.
         Falls back to pyautogui.write() for pure ASCII text.
         """
-        # Check if text is pure ASCII
-        try:
-            text.encode("ascii")
-            is_ascii = True
-        except UnicodeEncodeError:
-            is_ascii = False
-
-        if is_ascii:
+        if text.isascii():
             pyautogui.write(text, interval=0.02)
+        elif pyperclip is None:
+            # Raised so the monitor reports it in the GUI log
+            raise ImportError("pyperclip이 설치되지 않아 유니코드 텍스트를 입력할 수 없습니다.")
         else:
             # Use clipboard paste for Korean / Unicode text
-            import pyperclip
             old_clipboard = ""
             try:
                 old_clipboard = pyperclip.paste()
             except Exception:
                 pass
             pyperclip.copy(text)
-            # Ctrl+V on Windows, Cmd+V on Mac
-            if _IS_WINDOWS:
-                pyautogui.hotkey("ctrl", "v")
-            else:
-                pyautogui.hotkey("command", "v")
+            pyautogui.hotkey(*_PASTE_HOTKEY)
             time.sleep(0.1)
             # Restore original clipboard
             try:
@@ -0,0 +1,113 @@
+"""Per-tick screen frame shared by the image and text matchers."""
+import hashlib
+
+import cv2
+import numpy as np
+from typing import Optional
+
+
+class Frame:
+    """
+    A screenshot converted once per monitor tick.
+
+    Holds the RGB pixels and a grayscale copy for template matching.
+    Cropping returns ndarray views into the same buffers, so per-task
+    search regions cost no extra copies, and tasks sharing a region get
+    the same cropped frame along with its hash and downscaled image.
+    When CUDA matching is in use the grayscale image is uploaded to the
+    GPU at most once per frame.
+    """
+    __slots__ = (
+        "rgb", "gray", "offset", "_parent", "_gpu", "_digest", "_small", "_crops",
+    )
+
+    # Downscale factor of the coarse image used for pyramid matching
+    PYRAMID_SCALE = 4
+
+    def __init__(
+        self,
+        rgb: np.ndarray,
+        gray: Optional[np.ndarray] = None,
+        offset: tuple[int, int] = (0, 0),
+        parent: Optional["Frame"] = None,
+    ):
+        self.rgb = rgb
+        self.gray = gray if gray is not None else cv2.cvtColor(rgb, cv2.COLOR_RGB2GRAY)
+        # Position of this frame's top-left corner on the full screen
+        self.offset = offset
+        self._parent = parent
+        self._gpu = None
+        self._digest: Optional[bytes] = None
+        self._small: Optional[np.ndarray] = None
+        self._crops: dict[tuple[int, int, int, int], "Frame"] = {}
+
+    @property
+    def digest(self) -> bytes:
+        """8-byte content hash of the grayscale pixels, computed once."""
+        if self._digest is None:
+            # Region views are strided; hashing needs one contiguous buffer
+            self._digest = hashlib.blake2b(
+                np.ascontiguousarray(self.gray), digest_size=8
+            ).digest()
+        return self._digest
+
+    @property
+    def small(self) -> np.ndarray:
+        """Grayscale pixels downscaled by PYRAMID_SCALE, computed once."""
+        if self._small is None:
+            factor = 1.0 / self.PYRAMID_SCALE
+            self._small = cv2.resize(
+                self.gray, None, fx=factor, fy=factor, interpolation=cv2.INTER_AREA
+            )
+        return self._small
+
+    @property
+    def width(self) -> int:
+        return self.gray.shape[1]
+
+    @property
+    def height(self) -> int:
+        return self.gray.shape[0]
+
+    def crop(self, region: tuple[int, int, int, int]) -> "Frame":
+        """Return a view of the region (x1, y1, x2, y2), clamped to the frame."""
+        cached = self._crops.get(region)
+        if cached is not None:
+            return cached
+
+        x1, y1, x2, y2 = region
+        x1 = max(0, min(x1, self.width))
+        y1 = max(0, min(y1, self.height))
+        x2 = max(x1, min(x2, self.width))
+        y2 = max(y1, min(y2, self.height))
+        sub = Frame(
+            self.rgb[y1:y2, x1:x2],
+            self.gray[y1:y2, x1:x2],
+            (self.offset[0] + x1, self.offset[1] + y1),
+            parent=self,
+        )
+        self._crops[region] = sub
+        return sub
+
+    def gpu_gray(self):
+        """
+        Grayscale pixels as a cv2.cuda_GpuMat, uploaded on first use.
+
+        Cropped frames reference a region of their parent's upload instead
+        of transferring their pixels again.
+        """
+        if self._gpu is None:
+            if self._parent is not None:
+                x = self.offset[0] - self._parent.offset[0]
+                y = self.offset[1] - self._parent.offset[1]
+                self._gpu = cv2.cuda_GpuMat(
+                    self._parent.gpu_gray(), (x, y, self.width, self.height)
+                )
+            else:
+                self._gpu = cv2.cuda_GpuMat()
+                self._gpu.upload(self.gray)
+        return self._gpu
+
+    def to_screen(self, coords: tuple[int, int]) -> tuple[int, int]:
+        """Translate frame-local coordinates back to full-screen coordinates."""
+        return (coords[0] + self.offset[0], coords[1] + self.offset[1])
@@ -1,19 +1,344 @@
 """Image template matching using OpenCV."""
+import os
+import threading
+from collections import OrderedDict
+
 import cv2
 import numpy as np
-from PIL import Image
 from typing import Optional
 
+from core.frame import Frame
+
+# Maximum number of decoded templates kept in memory
+_TEMPLATE_CACHE_SIZE = 64
+
+# Coarse-to-fine matching: templates at least this large (both sides) are
+# first matched on Frame.small, then refined at full resolution around
+# each coarse peak with this much padding.
+_PYRAMID_MIN_TEMPLATE = 32
+_PYRAMID_PAD = 2 * Frame.PYRAMID_SCALE
+# Coarse scores are blurrier, so candidates are accepted slightly below
+# the real threshold, and further below by however much the template loses
+# against itself when it sits off the downscaling grid
+_PYRAMID_SLACK = 0.1
+# Templates whose coarse threshold would drop below this (fine texture that
+# does not survive downscaling) are matched at full resolution instead
+_PYRAMID_MIN_COARSE = 0.5
+
+# Maximum number of reusable matchTemplate result buffers (one per shape)
+_RESULT_BUFFER_COUNT = 16
+
+# Hits whose centers are less than this many px apart on both axes are
+# the same match
+_DUPLICATE_DIST = 10
+# Only scores that are the maximum of their neighbourhood within this
+# radius are passed on to duplicate suppression
+_PEAK_RADIUS = _DUPLICATE_DIST - 1
+# Below this many raw hits suppression is cheaper than the peak filter itself
+_PEAK_FILTER_MIN_HITS = 8192
+
+
+def _peak_kernel(radius: int) -> np.ndarray:
+    return np.ones((2 * radius + 1, 2 * radius + 1), dtype=np.uint8)
+
+
+_PEAK_KERNEL = _peak_kernel(_PEAK_RADIUS)
+_COARSE_PEAK_KERNEL = _peak_kernel(max(1, _PEAK_RADIUS // Frame.PYRAMID_SCALE))
+
+
+def _find_peaks(
+    result: np.ndarray, threshold: float, kernel: np.ndarray = _PEAK_KERNEL
+) -> tuple[np.ndarray, np.ndarray]:
+    """Return (ys, xs) of local maxima of a score map at or above threshold."""
+    mask = result >= threshold
+    ys, xs = np.nonzero(mask)
+    if ys.size <= _PEAK_FILTER_MIN_HITS:
+        return ys, xs
+    # Grey dilation is a running maximum over the kernel window
+    local_max = cv2.dilate(result, kernel)
+    return np.nonzero(mask & (result >= local_max))
+
 
 class ImageMatcher:
-    """Finds template images on screen using OpenCV template matching."""
+    """
+    Finds template images on screen using OpenCV template matching.
+
+    Matching runs on grayscale: TM_CCOEFF_NORMED does not need color and a
+    single channel is a third of the convolution work. Large templates are
+    located on a downscaled copy first and refined at full resolution only
+    around promising peaks. When OpenCV is built
+    with CUDA and a device is present, matching runs on the GPU instead,
+    falling back to the CPU if a CUDA call fails.
+
+    Safe to call from several threads: the caches are locked, CPU result
+    buffers are per thread and GPU calls are serialized.
+    """
 
     def __init__(self, confidence: float = 0.8):
         self.confidence = confidence
+        # template_path -> (mtime, decoded grayscale template), in LRU order
+        self._template_cache: OrderedDict[str, tuple[float, np.ndarray]] = OrderedDict()
+        # Guards _template_cache and _small_templates
+        self._cache_lock = threading.Lock()
+
+        # CUDA state (resolved lazily, see gpu_enabled)
+        self._gpu: Optional[bool] = None
+        self._gpu_matcher = None
+        # One CUDA matcher and stream, so GPU work runs one call at a time
+        self._gpu_lock = threading.Lock()
+        # template_path -> (host template it was uploaded from, GpuMat)
+        self._gpu_templates: dict[str, tuple[np.ndarray, object]] = {}
+        # template_path -> (full-size template, downscaled template,
+        # worst coarse self-score over grid offsets)
+        self._small_templates: dict[str, tuple[np.ndarray, np.ndarray, float]] = {}
+        # Per thread: (result height, result width) -> float32 score buffer
+        self._local = threading.local()
+
+    @property
+    def gpu_enabled(self) -> bool:
+        """Whether template matching runs on a CUDA device."""
+        if self._gpu is None:
+            try:
+                self._gpu = cv2.cuda.getCudaEnabledDeviceCount() > 0
+            except (AttributeError, cv2.error):
+                self._gpu = False
+        return self._gpu
+
+    def _disable_gpu(self, err: Exception):
+        print(f"[경고] CUDA 템플릿 매칭 실패, CPU로 전환합니다: {err}")
+        self._gpu = False
+        self._gpu_matcher = None
+        self._gpu_templates.clear()
+
+    def _get_gpu_matcher(self):
+        if self._gpu_matcher is None:
+            self._gpu_matcher = cv2.cuda.createTemplateMatching(
+                cv2.CV_8UC1, cv2.TM_CCOEFF_NORMED
+            )
+        return self._gpu_matcher
+
+    def warm_up(self):
+        """
+        Run one throwaway GPU match so the one-time CUDA module load/JIT
+        cost is paid before the first real tick. No-op without CUDA.
+        """
+        if not self.gpu_enabled:
+            return
+        try:
+            with self._gpu_lock:
+                screen = cv2.cuda_GpuMat()
+                screen.upload(np.zeros((64, 64), dtype=np.uint8))
+                template = cv2.cuda_GpuMat()
+                template.upload(np.zeros((8, 8), dtype=np.uint8))
+                self._get_gpu_matcher().match(screen, template)
+        except cv2.error as e:
+            self._disable_gpu(e)
+
+    def _load_template(self, template_path: str) -> Optional[np.ndarray]:
+        """
+        Load a template image, reusing the decoded copy while the file is unchanged.
+
+        Returns:
+            Grayscale ndarray of the template, or None if it cannot be read
+        """
+        with self._cache_lock:
+            try:
+                mtime = os.stat(template_path).st_mtime
+            except OSError:
+                self._template_cache.pop(template_path, None)
+                return None
+
+            cached = self._template_cache.get(template_path)
+            if cached is not None and cached[0] == mtime:
+                self._template_cache.move_to_end(template_path)
+                return cached[1]
+
+            template = cv2.imread(template_path, cv2.IMREAD_GRAYSCALE)
+            if template is None:
+                self._template_cache.pop(template_path, None)
+                return None
+
+            self._template_cache[template_path] = (mtime, template)
+            self._template_cache.move_to_end(template_path)
+            if len(self._template_cache) > _TEMPLATE_CACHE_SIZE:
+                evicted, _ = self._template_cache.popitem(last=False)
+                self._gpu_templates.pop(evicted, None)
+                self._small_templates.pop(evicted, None)
+            return template
+
+    def _small_template(
+        self, template_path: str, template: np.ndarray
+    ) -> tuple[np.ndarray, float]:
+        """
+        Return the template downscaled to Frame.small resolution, and the
+        lowest coarse score it gets against itself over every offset from
+        the downscaling grid.
+        """
+        with self._cache_lock:
+            cached = self._small_templates.get(template_path)
+            if cached is not None and cached[0] is template:
+                return cached[1], cached[2]
+            scale = Frame.PYRAMID_SCALE
+            factor = 1.0 / scale
+            small = cv2.resize(
+                template, None, fx=factor, fy=factor, interpolation=cv2.INTER_AREA
+            )
+            padded = cv2.copyMakeBorder(
+                template, scale, scale, scale, scale, cv2.BORDER_REPLICATE
+            )
+            worst = 1.0
+            for dy in range(scale):
+                for dx in range(scale):
+                    # The template starting (dx, dy) px into a grid cell
+                    shifted = cv2.resize(
+                        padded[scale - dy:, scale - dx:], None,
+                        fx=factor, fy=factor, interpolation=cv2.INTER_AREA,
+                    )
+                    score = cv2.minMaxLoc(
+                        cv2.matchTemplate(shifted, small, cv2.TM_CCOEFF_NORMED)
+                    )[1]
+                    worst = min(worst, score)
+            self._small_templates[template_path] = (template, small, worst)
+            return small, worst
+
+    def _coarse_threshold(
+        self, template_path: str, template: np.ndarray, threshold: float
+    ) -> Optional[float]:
+        """
+        Return the score coarse candidates must reach, or None when the
+        template should be matched at full resolution only.
+        """
+        if min(template.shape[:2]) < _PYRAMID_MIN_TEMPLATE:
+            return None
+        _, worst = self._small_template(template_path, template)
+        coarse_threshold = threshold - _PYRAMID_SLACK - (1.0 - worst)
+        if coarse_threshold < _PYRAMID_MIN_COARSE:
+            return None
+        return coarse_threshold
+
+    def _coarse_peaks(
+        self,
+        frame: Frame,
+        template_path: str,
+        template: np.ndarray,
+        coarse_threshold: float,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Return (cxs, cys) of the distinct coarse peaks, best score first."""
+        small, _ = self._small_template(template_path, template)
+        coarse = self._match_cpu(frame.small, small)
+        cys, cxs = _find_peaks(coarse, coarse_threshold, _COARSE_PEAK_KERNEL)
+        if cxs.size == 0:
+            return cxs, cys
+        coarse_dist = max(1, -(-_DUPLICATE_DIST // Frame.PYRAMID_SCALE))
+        peaks = self._suppress_duplicates(cxs, cys, coarse[cys, cxs], coarse_dist)
+        return cxs[peaks], cys[peaks]
+
+    def _refine_window(
+        self, frame: Frame, coarse_loc: tuple[int, int], template: np.ndarray
+    ) -> tuple[int, int, np.ndarray]:
+        """
+        Return (x0, y0, window): the full-resolution area around a coarse
+        peak, always at least as large as the template.
+        """
+        template_h, template_w = template.shape[:2]
+        scale = Frame.PYRAMID_SCALE
+        x0 = max(0, min(coarse_loc[0] * scale - _PYRAMID_PAD, frame.width - template_w))
+        y0 = max(0, min(coarse_loc[1] * scale - _PYRAMID_PAD, frame.height - template_h))
+        x1 = min(frame.width, x0 + template_w + 2 * _PYRAMID_PAD)
+        y1 = min(frame.height, y0 + template_h + 2 * _PYRAMID_PAD)
+        return x0, y0, frame.gray[y0:y1, x0:x1]
+
+    def _match_cpu(self, image: np.ndarray, template: np.ndarray) -> np.ndarray:
+        """
+        TM_CCOEFF_NORMED on the CPU, writing into a reused result buffer.
+
+        The returned map is overwritten by the next match of the same
+        shape, so callers must finish with it (or copy it) first.
+        """
+        buffers = getattr(self._local, "buffers", None)
+        if buffers is None:
+            buffers = self._local.buffers = OrderedDict()
+        shape = (image.shape[0] - template.shape[0] + 1, image.shape[1] - template.shape[1] + 1)
+        buffer = buffers.get(shape)
+        if buffer is None:
+            buffer = np.empty(shape, dtype=np.float32)
+            buffers[shape] = buffer
+            if len(buffers) > _RESULT_BUFFER_COUNT:
+                buffers.popitem(last=False)
+        else:
+            buffers.move_to_end(shape)
+        return cv2.matchTemplate(image, template, cv2.TM_CCOEFF_NORMED, result=buffer)
+
+    def _upload_template(self, template_path: str, template: np.ndarray):
+        """Return the GPU copy of a cached template, uploading it if stale."""
+        cached = self._gpu_templates.get(template_path)
+        if cached is not None and cached[0] is template:
+            return cached[1]
+        gpu_template = cv2.cuda_GpuMat()
+        gpu_template.upload(template)
+        self._gpu_templates[template_path] = (template, gpu_template)
+        return gpu_template
+
+    def _match_gpu(self, frame: Frame, template_path: str, template: np.ndarray):
+        return self._get_gpu_matcher().match(
+            frame.gpu_gray(), self._upload_template(template_path, template)
+        )
+
+    def _best_match(
+        self, frame: Frame, template_path: str, template: np.ndarray, threshold: float
+    ) -> tuple[float, tuple[int, int]]:
+        """
+        Return (max score, top-left location) of the best match.
+
+        With the pyramid every coarse candidate is refined. If there is none
+        the score is -1.0, which is enough for the caller to reject it; if
+        none holds up, one full-resolution pass decides, so a look-alike
+        winning the coarse pass costs time rather than the target.
+        """
+        if self.gpu_enabled:
+            try:
+                with self._gpu_lock:
+                    result = self._match_gpu(frame, template_path, template)
+                    _, max_val, _, max_loc = cv2.cuda.minMaxLoc(result)
+                return max_val, max_loc
+            except cv2.error as e:
+                self._disable_gpu(e)
+
+        coarse_threshold = self._coarse_threshold(template_path, template, threshold)
+        if coarse_threshold is not None:
+            cxs, cys = self._coarse_peaks(frame, template_path, template, coarse_threshold)
+            if cxs.size == 0:
+                return -1.0, (0, 0)
+            best_val, best_loc = -1.0, (0, 0)
+            for cx, cy in zip(cxs, cys):
+                x0, y0, window = self._refine_window(frame, (int(cx), int(cy)), template)
+                result = self._match_cpu(window, template)
+                _, max_val, _, max_loc = cv2.minMaxLoc(result)
+                if max_val > best_val:
+                    best_val, best_loc = max_val, (max_loc[0] + x0, max_loc[1] + y0)
+            if best_val >= threshold:
+                return best_val, best_loc
+
+        result = self._match_cpu(frame.gray, template)
+        _, max_val, _, max_loc = cv2.minMaxLoc(result)
+        return max_val, max_loc
+
+    def _match_map(
+        self, frame: Frame, template_path: str, template: np.ndarray
+    ) -> np.ndarray:
+        """Return the full TM_CCOEFF_NORMED score map as a host ndarray."""
+        if self.gpu_enabled:
+            try:
+                with self._gpu_lock:
+                    return self._match_gpu(frame, template_path, template).download()
+            except cv2.error as e:
+                self._disable_gpu(e)
+
+        return self._match_cpu(frame.gray, template)
 
     def find_template(
         self,
-        screenshot: Image.Image,
+        frame: Frame,
         template_path: str,
         confidence: Optional[float] = None,
     ) -> Optional[tuple[int, int]]:
@@ -21,29 +346,27 @@ class ImageMatcher:
         Find a template image within a screenshot.
 
         Args:
-            screenshot: PIL Image of the current screen
+            frame: Frame of the current screen (or a cropped region of it)
             template_path: Path to the template image file
             confidence: Override default confidence threshold
 
         Returns:
-            (x, y) center coordinates of the match, or None if not found
+            (x, y) center coordinates of the match relative to the frame,
+            or None if not found
         """
         threshold = confidence if confidence is not None else self.confidence
 
-        # Convert screenshot to numpy array (BGR for OpenCV)
-        screen_np = np.array(screenshot)
-        screen_bgr = cv2.cvtColor(screen_np, cv2.COLOR_RGB2BGR)
-
         # Load template
-        template = cv2.imread(template_path)
+        template = self._load_template(template_path)
         if template is None:
             return None
 
         template_h, template_w = template.shape[:2]
+        if template_h > frame.height or template_w > frame.width:
+            return None
 
         # Perform template matching
-        result = cv2.matchTemplate(screen_bgr, template, cv2.TM_CCOEFF_NORMED)
-        min_val, max_val, min_loc, max_loc = cv2.minMaxLoc(result)
+        max_val, max_loc = self._best_match(frame, template_path, template, threshold)
 
         if max_val >= threshold:
             # Return center of matched region
@@ -55,7 +378,7 @@ class ImageMatcher:
 
     def find_all_templates(
         self,
-        screenshot: Image.Image,
+        frame: Frame,
         template_path: str,
         confidence: Optional[float] = None,
     ) -> list[tuple[int, int]]:
@@ -67,29 +390,92 @@ class ImageMatcher:
         """
         threshold = confidence if confidence is not None else self.confidence
 
-        screen_np = np.array(screenshot)
-        screen_bgr = cv2.cvtColor(screen_np, cv2.COLOR_RGB2BGR)
-
-        template = cv2.imread(template_path)
+        template = self._load_template(template_path)
         if template is None:
             return []
 
         template_h, template_w = template.shape[:2]
+        if template_h > frame.height or template_w > frame.width:
+            return []
 
-        result = cv2.matchTemplate(screen_bgr, template, cv2.TM_CCOEFF_NORMED)
-        locations = np.where(result >= threshold)
-
-        matches = []
-        for pt in zip(*locations[::-1]):
-            center_x = pt[0] + template_w // 2
-            center_y = pt[1] + template_h // 2
-            # Avoid duplicate nearby detections (within 10px)
-            is_duplicate = False
-            for existing in matches:
-                if abs(center_x - existing[0]) < 10 and abs(center_y - existing[1]) < 10:
-                    is_duplicate = True
-                    break
-            if not is_duplicate:
-                matches.append((center_x, center_y))
-
-        return matches
+        coarse_threshold = (
+            None if self.gpu_enabled
+            else self._coarse_threshold(template_path, template, threshold)
+        )
+        hits = None
+        if coarse_threshold is not None:
+            hits = self._pyramid_hits(
+                frame, template_path, template, threshold, coarse_threshold
+            )
+        if hits is not None:
+            xs, ys, scores = hits
+        else:
+            result = self._match_map(frame, template_path, template)
+            ys, xs = _find_peaks(result, threshold)
+            scores = result[ys, xs]
+        if xs.size == 0:
+            return []
+
+        keep = self._suppress_duplicates(xs, ys, scores)
+        centers = np.column_stack([xs[keep], ys[keep]]) + (template_w // 2, template_h // 2)
+        # Keep the original top-to-bottom, left-to-right ordering
+        centers = centers[np.lexsort((centers[:, 0], centers[:, 1]))]
+        return [(int(x), int(y)) for x, y in centers]
+
+    def _pyramid_hits(
+        self,
+        frame: Frame,
+        template_path: str,
+        template: np.ndarray,
+        threshold: float,
+        coarse_threshold: float,
+    ) -> Optional[tuple[np.ndarray, np.ndarray, np.ndarray]]:
+        """
+        Collect full-resolution hits (xs, ys, scores) by refining every
+        distinct coarse peak of the downscaled match.
+
+        Returns None when there were coarse candidates but none of them
+        held up, so the caller can decide with a full-resolution pass.
+        """
+        cxs, cys = self._coarse_peaks(frame, template_path, template, coarse_threshold)
+        empty = np.empty(0, dtype=np.intp)
+        if cxs.size == 0:
+            return empty, empty, np.empty(0, dtype=np.float32)
+
+        all_xs, all_ys, all_scores = [], [], []
+        for cx, cy in zip(cxs, cys):
+            x0, y0, window = self._refine_window(frame, (int(cx), int(cy)), template)
+            result = self._match_cpu(window, template)
+            ys, xs = _find_peaks(result, threshold)
+            all_xs.append(xs + x0)
+            all_ys.append(ys + y0)
+            all_scores.append(result[ys, xs])
+        xs = np.concatenate(all_xs)
+        if xs.size == 0:
+            return None
+        return xs, np.concatenate(all_ys), np.concatenate(all_scores)
+
+    @staticmethod
+    def _suppress_duplicates(
+        xs: np.ndarray,
+        ys: np.ndarray,
+        scores: np.ndarray,
+        min_dist: int = _DUPLICATE_DIST,
+    ) -> np.ndarray:
+        """
+        Return indices of the hits that survive duplicate suppression.
+
+        Greedy by score: the best remaining hit is kept and every hit less
+        than min_dist px from it on both axes is dropped, whatever the
+        template size.
+        """
+        order = np.argsort(-scores, kind="stable")
+        keep = []
+        while order.size:
+            best = order[0]
+            keep.append(best)
+            near = (np.abs(xs[order] - xs[best]) < min_dist) & (
+                np.abs(ys[order] - ys[best]) < min_dist
+            )
+            order = order[~near]
+        return np.asarray(keep, dtype=np.intp)
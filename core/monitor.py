@@ -1,17 +1,31 @@
 """Screen monitoring engine that runs in a background thread."""
+import os
 import time
 import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Callable, Optional
 
+import cv2
+import numpy as np
 import pyautogui
-from PIL import Image
 
+try:
+    import mss
+except ImportError:  # optional fast capture backend, pyautogui is the fallback
+    mss = None
+
+from core.frame import Frame
 from core.image_matcher import ImageMatcher
 from core.text_recognizer import TextRecognizer
 from core.action_executor import ActionExecutor
 from models.task import Task, TaskType, TaskManager, MixGroup, ConditionType
 
+# Threads searching tasks within one tick. matchTemplate releases the GIL and
+# tesseract runs as a subprocess, so searches overlap; kept small because
+# tesseract is itself multi-threaded.
+_SEARCH_WORKERS = min(4, os.cpu_count() or 1)
+
 
 class MonitorEngine:
     """
@@ -41,6 +55,19 @@ class MonitorEngine:
         # Track last action time per task to implement cooldown
         self._last_action: dict[str, float] = {}
 
+        # Last search result per task: task.id -> (task, frame digest, coords).
+        # A static screen hashes the same, so the match can be skipped.
+        self._match_cache: dict[
+            str, tuple[Task, bytes, Optional[tuple[int, int]]]
+        ] = {}
+
+        # mss handles are bound to the thread that created them
+        self._capture = threading.local()
+
+        self._pool = ThreadPoolExecutor(
+            max_workers=_SEARCH_WORKERS, thread_name_prefix="search"
+        )
+
     @property
     def is_running(self) -> bool:
         return self._running
@@ -97,32 +124,61 @@ class MonitorEngine:
         """Set the monitoring interval in seconds."""
         self.interval = max(0.3, interval)
 
-    def _take_screenshot(self) -> Image.Image:
-        """Take a screenshot of the entire screen."""
-        return pyautogui.screenshot()
+    def _take_screenshot(self) -> np.ndarray:
+        """Take a screenshot of the primary screen as an RGB array."""
+        if mss is None:
+            screenshot = pyautogui.screenshot()
+            # convert() always copies, even when the mode already matches
+            if screenshot.mode != "RGB":
+                screenshot = screenshot.convert("RGB")
+            return np.asarray(screenshot)
+
+        sct = getattr(self._capture, "sct", None)
+        if sct is None:
+            sct = self._capture.sct = mss.mss()
+        # monitors[1] is the primary display, matching pyautogui coordinates
+        shot = sct.grab(sct.monitors[1])
+        bgra = np.frombuffer(shot.raw, dtype=np.uint8).reshape(shot.height, shot.width, 4)
+        return cv2.cvtColor(bgra, cv2.COLOR_BGRA2RGB)
+
+    def _close_capture(self):
+        """Release this thread's mss handle, if any."""
+        sct = getattr(self._capture, "sct", None)
+        if sct is not None:
+            sct.close()
+            self._capture.sct = None
 
     def _monitor_loop(self):
         """Main monitoring loop."""
+        # Pay any one-time GPU initialization before the first tick
+        self.image_matcher.warm_up()
+
         while self._running:
             if self._paused:
                 time.sleep(0.5)
                 continue
 
             try:
-                screenshot = self._take_screenshot()
+                # Convert once per tick; every task searches this frame
+                frame = Frame(self._take_screenshot())
                 active_tasks = self.task_manager.get_active_tasks()
-
-                for task in active_tasks:
+                self._prune_match_cache()
+                # Text tasks sharing a region get one OCR pass between them
+                self._prefetch_text_targets(frame, self._due_text_tasks(active_tasks))
+
+                # Check cooldown
+                now = time.time()
+                due_tasks = [
+                    t for t in active_tasks
+                    if now - self._last_action.get(t.id, 0) >= t.cooldown
+                ]
+
+                # Search concurrently, then act in task order on this thread
+                found = self._find_targets(due_tasks, frame)
+                for task, coords in zip(due_tasks, found):
                     if not self._running:
                         break
 
-                    # Check cooldown
-                    last_time = self._last_action.get(task.id, 0)
-                    if time.time() - last_time < task.cooldown:
-                        continue
-
-                    coords = self._find_target(task, screenshot)
-
                     # Auto-scroll logic: if not found and auto_scroll enabled
                     if coords is None and task.auto_scroll:
                         coords = self._find_with_scroll(task)
@@ -142,15 +198,26 @@ class MonitorEngine:
                         self._last_action[task.id] = time.time()
 
                 # Process mix groups
-                self._process_mix_groups(screenshot)
+                self._process_mix_groups(frame)
 
             except Exception as e:
                 self._log(f"⚠️ 오류: {str(e)}")
 
             time.sleep(self.interval)
 
-    def _process_mix_groups(self, screenshot: Image.Image):
-        """Evaluate active mix groups against the current screenshot."""
+        self._close_capture()
+
+    def _prune_match_cache(self):
+        """Drop cached results of tasks that no longer exist."""
+        stale = [
+            tid for tid in self._match_cache
+            if self.task_manager.get_task(tid) is None
+        ]
+        for tid in stale:
+            del self._match_cache[tid]
+
+    def _process_mix_groups(self, frame: Frame):
+        """Evaluate active mix groups against the current frame."""
         active_groups = self.task_manager.get_active_mix_groups()
 
         for group in active_groups:
@@ -173,10 +240,9 @@ class MonitorEngine:
                 continue
 
             # Evaluate condition
-            results: list[tuple[Task, Optional[tuple[int, int]]]] = []
-            for task in child_tasks:
-                coords = self._find_target(task, screenshot)
-                results.append((task, coords))
+            results: list[tuple[Task, Optional[tuple[int, int]]]] = list(
+                zip(child_tasks, self._find_targets(child_tasks, frame))
+            )
 
             if group.condition == ConditionType.AND:
                 # All must match
@@ -208,44 +274,97 @@ class MonitorEngine:
                         self._last_action[f"mix_{group.id}"] = time.time()
                         break
 
-    def _crop_to_region(
-        self, screenshot: Image.Image, region: tuple[int, int, int, int]
-    ) -> Image.Image:
-        """Crop screenshot to the specified region (x1, y1, x2, y2)."""
-        x1, y1, x2, y2 = region
-        # Clamp to screenshot bounds
-        x1 = max(0, min(x1, screenshot.width))
-        y1 = max(0, min(y1, screenshot.height))
-        x2 = max(x1, min(x2, screenshot.width))
-        y2 = max(y1, min(y2, screenshot.height))
-        return screenshot.crop((x1, y1, x2, y2))
+    def _due_text_tasks(self, active_tasks: list[Task]) -> list[Task]:
+        """
+        TEXT tasks that will be searched this tick: active tasks out of
+        cooldown plus the children of mix groups out of cooldown.
+        """
+        now = time.time()
+        tasks = [
+            t for t in active_tasks
+            if t.task_type == TaskType.TEXT
+            and now - self._last_action.get(t.id, 0) >= t.cooldown
+        ]
+        for group in self.task_manager.get_active_mix_groups():
+            if now - self._last_action.get(f"mix_{group.id}", 0) < group.cooldown:
+                continue
+            for tid in group.task_ids:
+                task = self.task_manager.get_task(tid)
+                if task and task.task_type == TaskType.TEXT:
+                    tasks.append(task)
+        return tasks
+
+    def _prefetch_text_targets(self, frame: Frame, tasks: list[Task]):
+        """
+        OCR each distinct search region once for all TEXT tasks sharing it.
+
+        Results land in the match cache, so the following _find_target
+        calls for these tasks return without running OCR again.
+        """
+        groups: dict[Optional[tuple], tuple[Frame, list[Task]]] = {}
+        seen: set[str] = set()
+        for task in tasks:
+            if task.task_type != TaskType.TEXT or not task.search_text or task.id in seen:
+                continue
+            seen.add(task.id)
+            region = task.search_region
+            if region not in groups:
+                groups[region] = (frame.crop(region) if region else frame, [])
+            search, pending = groups[region]
+            cached = self._match_cache.get(task.id)
+            if cached is None or cached[0] is not task or cached[1] != search.digest:
+                pending.append(task)
+
+        # A lone task gains nothing from batching; _find_target handles it
+        batches = [(search, pending) for search, pending in groups.values() if len(pending) > 1]
+        found = self._pool.map(
+            lambda batch: self.text_recognizer.find_many(
+                batch[0].rgb, [t.search_text for t in batch[1]]
+            ),
+            batches,
+        )
+        for (search, pending), batch_coords in zip(batches, found):
+            for task, coords in zip(pending, batch_coords):
+                if coords:
+                    coords = search.to_screen(coords)
+                self._match_cache[task.id] = (task, search.digest, coords)
+
+    def _find_targets(
+        self, tasks: list[Task], frame: Frame
+    ) -> list[Optional[tuple[int, int]]]:
+        """Run _find_target for each task on the search pool, in task order."""
+        if len(tasks) < 2:
+            return [self._find_target(task, frame) for task in tasks]
+        return list(self._pool.map(self._find_target, tasks, [frame] * len(tasks)))
 
     def _find_target(
-        self, task: Task, screenshot: Image.Image
+        self, task: Task, frame: Frame
     ) -> Optional[tuple[int, int]]:
         """Find the target for a specific task, applying search region if set."""
-        # Apply search region crop
-        offset_x, offset_y = 0, 0
-        search_img = screenshot
+        # Region crops are views into the frame, not copies
+        search = frame.crop(task.search_region) if task.search_region else frame
 
-        if task.search_region:
-            offset_x, offset_y = task.search_region[0], task.search_region[1]
-            search_img = self._crop_to_region(screenshot, task.search_region)
+        # Skip the search entirely if this task's region is unchanged
+        digest = search.digest
+        cached = self._match_cache.get(task.id)
+        if cached is not None and cached[0] is task and cached[1] == digest:
+            return cached[2]
 
         coords = None
         if task.task_type == TaskType.IMAGE:
             if task.template_path:
                 coords = self.image_matcher.find_template(
-                    search_img, task.template_path, task.confidence
+                    search, task.template_path, task.confidence
                 )
         elif task.task_type == TaskType.TEXT:
             if task.search_text:
-                coords = self.text_recognizer.find_text(search_img, task.search_text)
+                coords = self.text_recognizer.find_text(search.rgb, task.search_text)
 
         # Adjust coordinates back to full screen if region was used
-        if coords and task.search_region:
-            coords = (coords[0] + offset_x, coords[1] + offset_y)
+        if coords:
+            coords = search.to_screen(coords)
 
+        self._match_cache[task.id] = (task, digest, coords)
         return coords
 
     def _find_with_scroll(self, task: Task) -> Optional[tuple[int, int]]:
@@ -260,9 +379,9 @@ class MonitorEngine:
             scroll_cy = (scroll_area[1] + scroll_area[3]) // 2
         else:
             # Default: center of screen
-            screen = self._take_screenshot()
-            scroll_cx = screen.width // 2
-            scroll_cy = screen.height // 2
+            height, width = self._take_screenshot().shape[:2]
+            scroll_cx = width // 2
+            scroll_cy = height // 2
 
         self._log(f"🔄 '{task.name}' 자동 스크롤 검색 시작...")
 
@@ -276,8 +395,8 @@ class MonitorEngine:
             time.sleep(0.5)  # wait for content to settle
 
             # Re-capture and search
-            new_screenshot = self._take_screenshot()
-            coords = self._find_target(task, new_screenshot)
+            new_frame = Frame(self._take_screenshot())
+            coords = self._find_target(task, new_frame)
             if coords:
                 self._log(f"🔄 스크롤 {i + 1}회 후 발견!")
                 return coords
@@ -1,9 +1,14 @@
 """Text recognition using pytesseract OCR."""
+import hashlib
 import os
 import platform
+import threading
+from collections import OrderedDict
+
+import numpy as np
 import pytesseract
 from PIL import Image
-from typing import Optional
+from typing import Optional, Union
 
 # Auto-detect Tesseract on Windows
 if platform.system() == "Windows":
@@ -18,6 +23,69 @@ _TESSERACT_INSTALL_HINT = (
 )
 
 
+# pytesseract accepts either form; the monitor passes RGB ndarray views
+ImageLike = Union[Image.Image, np.ndarray]
+
+# Number of OCR results kept, keyed by image content
+_OCR_CACHE_SIZE = 4
+
+
+class _OcrIndex:
+    """
+    image_to_data output arranged for searching.
+
+    Built once per OCR result, so every search string matched against a
+    screen (and every later tick on an unchanged screen) shares the text
+    normalisation and line grouping.
+    """
+    __slots__ = ("texts", "left", "top", "width", "bottom", "lines")
+
+    def __init__(self, data: dict):
+        texts = np.char.lower(np.char.strip(np.asarray(data["text"], dtype=str)))
+        idx = np.flatnonzero(np.char.str_len(texts) > 0)
+
+        # Only non-empty words are kept; positions below index these arrays
+        self.texts = texts[idx]
+        self.left = np.asarray(data["left"], dtype=np.int64)[idx]
+        self.top = np.asarray(data["top"], dtype=np.int64)[idx]
+        self.width = np.asarray(data["width"], dtype=np.int64)[idx]
+        self.bottom = self.top + np.asarray(data["height"], dtype=np.int64)[idx]
+        self.lines = _find_line_spans(
+            self.texts,
+            np.asarray(data["block_num"], dtype=np.int64)[idx],
+            np.asarray(data["line_num"], dtype=np.int64)[idx],
+        )
+
+
+def _find_line_spans(
+    texts: np.ndarray, block_nums: np.ndarray, line_nums: np.ndarray
+) -> list[tuple[np.ndarray, str, np.ndarray]]:
+    """
+    Group word positions by (block, line) in reading order.
+
+    Returns:
+        (word positions, joined lowercase text, start offset of each word
+        in the joined text) for every line with at least two words
+    """
+    if texts.size < 2:
+        return []
+    _, first, inverse, counts = np.unique(
+        block_nums * 10000 + line_nums,
+        return_index=True, return_inverse=True, return_counts=True,
+    )
+    groups = np.split(np.argsort(inverse, kind="stable"), np.cumsum(counts)[:-1])
+
+    lines = []
+    for line in np.argsort(first):
+        members = groups[line]
+        if members.size < 2:
+            continue
+        words = texts[members].tolist()
+        starts = np.cumsum([0] + [len(w) + 1 for w in words[:-1]])
+        lines.append((members, " ".join(words), starts))
+    return lines
+
+
 class TextRecognizer:
     """Finds text on screen using OCR."""
 
@@ -30,82 +98,125 @@ class TextRecognizer:
         """
         self.lang = lang
         self._tesseract_available = True  # flag to avoid spamming errors
+        # (content hash, shape, lang) -> indexed OCR result, in LRU order
+        self._ocr_cache: OrderedDict[tuple, _OcrIndex] = OrderedDict()
+        # OCR itself runs unlocked; only the cache is shared between threads
+        self._cache_lock = threading.Lock()
 
-    def find_text(
-        self,
-        screenshot: Image.Image,
-        search_text: str,
-    ) -> Optional[tuple[int, int]]:
+    def _ocr(self, screenshot: ImageLike) -> Optional[_OcrIndex]:
         """
-        Find text within a screenshot and return its center coordinates.
-
-        Args:
-            screenshot: PIL Image of the current screen
-            search_text: Text to search for (case-insensitive)
+        Run image_to_data on the image, reusing the result for identical
+        images so a static screen is not OCR'd again.
 
         Returns:
-            (x, y) center coordinates of the text, or None if not found
+            Indexed OCR result, or None if Tesseract is unavailable
         """
         if not self._tesseract_available:
             return None
+
+        pixels = np.asarray(screenshot)
+        key = (
+            hashlib.blake2b(np.ascontiguousarray(pixels), digest_size=8).digest(),
+            pixels.shape,
+            self.lang,
+        )
+        with self._cache_lock:
+            cached = self._ocr_cache.get(key)
+            if cached is not None:
+                self._ocr_cache.move_to_end(key)
+                return cached
+
         try:
             # Get detailed OCR data with bounding boxes
             data = pytesseract.image_to_data(
-                screenshot, lang=self.lang, output_type=pytesseract.Output.DICT
+                pixels, lang=self.lang, output_type=pytesseract.Output.DICT
             )
         except pytesseract.TesseractNotFoundError:
             print(f"[오류] Tesseract가 설치되지 않았습니다. {_TESSERACT_INSTALL_HINT}")
             self._tesseract_available = False
             return None
 
-        n_boxes = len(data["text"])
+        index = _OcrIndex(data)
+        with self._cache_lock:
+            self._ocr_cache[key] = index
+            if len(self._ocr_cache) > _OCR_CACHE_SIZE:
+                self._ocr_cache.popitem(last=False)
+        return index
+
+    def find_text(
+        self,
+        screenshot: ImageLike,
+        search_text: str,
+    ) -> Optional[tuple[int, int]]:
+        """
+        Find text within a screenshot and return its center coordinates.
+
+        Args:
+            screenshot: PIL Image or RGB ndarray of the current screen
+            search_text: Text to search for (case-insensitive)
+
+        Returns:
+            (x, y) center coordinates of the text, or None if not found
+        """
+        index = self._ocr(screenshot)
+        if index is None:
+            return None
+        return self._search_data(index, search_text)
+
+    def find_many(
+        self,
+        screenshot: ImageLike,
+        search_texts: list[str],
+    ) -> list[Optional[tuple[int, int]]]:
+        """
+        Find several texts in one screenshot with a single OCR pass.
+
+        Returns:
+            Center coordinates (or None) for each entry of search_texts
+        """
+        index = self._ocr(screenshot)
+        if index is None:
+            return [None] * len(search_texts)
+        return [self._search_data(index, text) for text in search_texts]
+
+    @staticmethod
+    def _search_data(index: "_OcrIndex", search_text: str) -> Optional[tuple[int, int]]:
+        """
+        Search an indexed OCR result for search_text.
+
+        Single words are checked first in one vectorized pass; failing that,
+        each line's joined text is searched so phrases spanning several
+        words are found too.
+        """
         search_lower = search_text.lower()
 
         # First, try to find the exact text in a single word
-        for i in range(n_boxes):
-            text = data["text"][i].strip()
-            if not text:
-                continue
-            if search_lower in text.lower():
-                x = data["left"][i]
-                y = data["top"][i]
-                w = data["width"][i]
-                h = data["height"][i]
-                return (x + w // 2, y + h // 2)
+        hits = np.flatnonzero(np.char.find(index.texts, search_lower) >= 0)
+        if hits.size:
+            i = hits[0]
+            return (
+                int(index.left[i] + index.width[i] // 2),
+                int(index.top[i] + (index.bottom[i] - index.top[i]) // 2),
+            )
 
         # If not found in single words, try consecutive words on the same line
-        for i in range(n_boxes):
-            text_i = data["text"][i].strip()
-            if not text_i:
+        for members, joined, starts in index.lines:
+            pos = joined.find(search_lower)
+            if pos < 0:
                 continue
-
-            # Build consecutive text on the same line
-            line_num = data["line_num"][i]
-            block_num = data["block_num"][i]
-            combined = text_i
-            last_idx = i
-
-            for j in range(i + 1, n_boxes):
-                if data["block_num"][j] == block_num and data["line_num"][j] == line_num:
-                    next_text = data["text"][j].strip()
-                    if next_text:
-                        combined += " " + next_text
-                        last_idx = j
-                        if search_lower in combined.lower():
-                            # Found it in combined text, return center of the span
-                            x1 = data["left"][i]
-                            y1 = data["top"][i]
-                            x2 = data["left"][last_idx] + data["width"][last_idx]
-                            y2 = max(
-                                data["top"][k] + data["height"][k]
-                                for k in range(i, last_idx + 1)
-                                if data["text"][k].strip()
-                            )
-                            return ((x1 + x2) // 2, (y1 + y2) // 2)
+            # Map the matched character span back to the words it covers
+            first_word = np.searchsorted(starts, pos, side="right") - 1
+            last_word = np.searchsorted(starts, pos + len(search_lower) - 1, side="right") - 1
+            span = members[first_word:last_word + 1]
+            x1 = index.left[span[0]]
+            x2 = index.left[span[-1]] + index.width[span[-1]]
+            y1 = index.top[span].min()
+            y2 = index.bottom[span].max()
+            return (int(x1 + x2) // 2, int(y1 + y2) // 2)
 
         return None
 
-    def get_all_text(self, screenshot: Image.Image) -> str:
+    def get_all_text(self, screenshot: ImageLike) -> str:
         """Extract all text from a screenshot."""
         try:
             return pytesseract.image_to_string(screenshot, lang=self.lang)
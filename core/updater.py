@@ -1,63 +1,103 @@
 """GitHub-based auto-update module for Screen Automator."""
+import functools
+import hashlib
 import json
 import os
+import re
 import shutil
 import tempfile
 import threading
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from typing import Callable, Optional, Tuple
-from urllib import request, error
+from urllib import request
 
 
 class UpdateInfo:
     """Holds information about an available update."""
-    __slots__ = ("version", "download_url", "release_url", "description")
-
-    def __init__(self, version: str, download_url: str, release_url: str, description: str = ""):
+    __slots__ = ("version", "download_url", "release_url", "description", "sha256")
+
+    def __init__(
+        self,
+        version: str,
+        download_url: str,
+        release_url: str,
+        description: str = "",
+        sha256: str = "",
+    ):
         self.version = version
         self.download_url = download_url
         self.release_url = release_url
         self.description = description
+        # Hex SHA-256 of the download, if the release publishes one
+        self.sha256 = sha256
+
+
+# Download read size
+_CHUNK_SIZE = 64 * 1024
+
+# Threads used to extract update files (I/O bound, GIL released)
+_IO_WORKERS = 8
+
+
+def _move_file(src: str, dst: str):
+    """Rename src over dst, copying only if they are on different filesystems."""
+    try:
+        os.replace(src, dst)
+    except OSError:
+        shutil.move(src, dst)
+
 
+def _remove_tree_async(path: str):
+    """Delete a directory tree without blocking the caller."""
+    # Not a daemon thread, so a restart right after the update still cleans up
+    threading.Thread(
+        target=shutil.rmtree, args=(path,), kwargs={"ignore_errors": True},
+    ).start()
 
+
+# Leading dotted-number part of a version tag ("2.1.0" in "v2.1.0-beta")
+_VERSION_RE = re.compile(r"\d+(?:\.\d+)*")
+
+
+@functools.lru_cache(maxsize=64)
 def _parse_version(v: str) -> tuple:
     """Parse version string like '2.1.0' into comparable tuple (2, 1, 0)."""
-    v = v.lstrip("vV")
-    parts = []
-    for p in v.split("."):
-        try:
-            parts.append(int(p))
-        except ValueError:
-            parts.append(0)
-    return tuple(parts)
+    m = _VERSION_RE.match(v.lstrip("vV"))
+    if not m:
+        return (0,)
+    return tuple(int(p) for p in m.group().split("."))
+
+
+# GitHub REST request headers for the release lookup
+RELEASE_API_HEADERS = {
+    "Accept": "application/vnd.github+json",
+    "User-Agent": "ScreenAutomator-Updater",
+}
+
+
+def release_api_url(github_repo: str) -> str:
+    """URL of the latest-release endpoint for an 'owner/repo' repository."""
+    return f"https://api.github.com/repos/{github_repo}/releases/latest"
 
 
-def check_update(
-    current_version: str,
-    github_repo: str,
-    timeout: float = 10.0,
-) -> Optional[UpdateInfo]:
+def parse_release(body: bytes, current_version: str) -> Optional[UpdateInfo]:
     """
-    Check GitHub Releases for a newer version.
+    Build UpdateInfo from a latest-release API response body.
 
     Args:
+        body: Raw JSON response from release_api_url
         current_version: Current app version (e.g. '2.1.0')
-        github_repo: GitHub repo in 'owner/repo' format
-        timeout: Request timeout in seconds
 
     Returns:
-        UpdateInfo if a newer version exists, None otherwise.
+        UpdateInfo if the release is newer than current_version, None
+        otherwise or if body is not a valid release.
     """
-    api_url = f"https://api.github.com/repos/{github_repo}/releases/latest"
-    req = request.Request(api_url, headers={
-        "Accept": "application/vnd.github+json",
-        "User-Agent": "ScreenAutomator-Updater",
-    })
-
     try:
-        with request.urlopen(req, timeout=timeout) as resp:
-            data = json.loads(resp.read().decode("utf-8"))
-    except (error.URLError, error.HTTPError, json.JSONDecodeError, OSError):
+        data = json.loads(body.decode("utf-8"))
+    except (UnicodeDecodeError, json.JSONDecodeError):
+        return None
+    if not isinstance(data, dict):
         return None
 
     tag = data.get("tag_name", "")
@@ -69,10 +109,15 @@ def check_update(
 
     # Find zip asset in release assets
     download_url = ""
+    sha256 = ""
     for asset in data.get("assets", []):
         name = asset.get("name", "").lower()
         if name.endswith(".zip"):
             download_url = asset.get("browser_download_url", "")
+            # GitHub publishes asset digests as "sha256:<hex>"
+            digest = asset.get("digest") or ""
+            if digest.startswith("sha256:"):
+                sha256 = digest[len("sha256:"):]
             break
 
     # Fallback to source zip if no asset found
@@ -84,31 +129,10 @@ def check_update(
         download_url=download_url,
         release_url=data.get("html_url", ""),
         description=data.get("body", ""),
+        sha256=sha256,
     )
 
 
-def check_update_async(
-    current_version: str,
-    github_repo: str,
-    callback: Callable[[Optional[UpdateInfo]], None],
-):
-    """
-    Check for updates in a background thread.
-
-    Args:
-        current_version: Current version string
-        github_repo: GitHub 'owner/repo'
-        callback: Called with UpdateInfo or None when check completes.
-                  This will be called from the background thread.
-    """
-    def _worker():
-        result = check_update(current_version, github_repo)
-        callback(result)
-
-    t = threading.Thread(target=_worker, daemon=True)
-    t.start()
-
-
 def download_and_apply_update(
     update_info: UpdateInfo,
     app_dir: str,
@@ -140,56 +164,92 @@ def download_and_apply_update(
     try:
         # 1. Download zip to temp file
         _log("📥 업데이트 다운로드 중...")
-        tmp_dir = tempfile.mkdtemp(prefix="sa_update_")
-        zip_path = os.path.join(tmp_dir, "update.zip")
-
-        req = request.Request(update_info.download_url, headers={
-            "User-Agent": "ScreenAutomator-Updater",
-        })
-        with request.urlopen(req, timeout=60) as resp:
-            with open(zip_path, "wb") as f:
-                f.write(resp.read())
-
-        _log("📦 압축 해제 중...")
-        # 2. Extract zip
-        extract_dir = os.path.join(tmp_dir, "extracted")
-        with zipfile.ZipFile(zip_path, "r") as zf:
-            zf.extractall(extract_dir)
-
-        # Find the actual root directory inside the zip
-        # (GitHub zips often have a single root folder)
-        entries = os.listdir(extract_dir)
-        if len(entries) == 1 and os.path.isdir(os.path.join(extract_dir, entries[0])):
-            source_dir = os.path.join(extract_dir, entries[0])
-        else:
-            source_dir = extract_dir
-
-        # 3. Preserve user data directories
-        preserve_dirs = {"config", "templates", "venv", ".git"}
-        preserve_files = set()
-
-        _log("🔄 파일 교체 중...")
-        # 4. Copy new files over existing ones
-        for root, dirs, files in os.walk(source_dir):
-            rel_root = os.path.relpath(root, source_dir)
-
-            # Skip preserved directories
-            dirs[:] = [d for d in dirs if d not in preserve_dirs]
-
-            for fname in files:
-                rel_path = os.path.join(rel_root, fname) if rel_root != "." else fname
-                src_file = os.path.join(root, fname)
-                dst_file = os.path.join(app_dir, rel_path)
-
-                # Create parent directories
-                dst_parent = os.path.dirname(dst_file)
-                os.makedirs(dst_parent, exist_ok=True)
-
-                # Copy file
-                shutil.copy2(src_file, dst_file)
-
-        # 5. Cleanup temp files
-        shutil.rmtree(tmp_dir, ignore_errors=True)
+        # Stage inside app_dir so new files can be renamed into place
+        try:
+            tmp_dir = tempfile.mkdtemp(prefix=".sa_update_", dir=app_dir)
+        except OSError:
+            tmp_dir = tempfile.mkdtemp(prefix="sa_update_")
+        try:
+            zip_path = os.path.join(tmp_dir, "update.zip")
+
+            req = request.Request(update_info.download_url, headers={
+                "User-Agent": "ScreenAutomator-Updater",
+            })
+            hasher = hashlib.sha256()
+            with request.urlopen(req, timeout=60) as resp:
+                total = int(resp.headers.get("Content-Length") or 0)
+                downloaded = 0
+                next_report = 10
+                with open(zip_path, "wb") as f:
+                    while chunk := resp.read(_CHUNK_SIZE):
+                        f.write(chunk)
+                        hasher.update(chunk)
+                        downloaded += len(chunk)
+                        if total and downloaded * 100 >= next_report * total:
+                            percent = downloaded * 100 // total
+                            _log(f"📥 다운로드 중... {percent}%")
+                            next_report = percent // 10 * 10 + 10
+
+            if update_info.sha256 and hasher.hexdigest() != update_info.sha256.lower():
+                return False, "업데이트 실패: 다운로드 파일 검증(SHA-256)에 실패했습니다."
+
+            _log("📦 압축 해제 중...")
+            # 2. Extract zip
+            extract_dir = os.path.join(tmp_dir, "extracted")
+            with zipfile.ZipFile(zip_path, "r") as zf:
+                members = zf.infolist()
+                # Create directories up front so the workers never race on makedirs
+                for member in members:
+                    parts = [
+                        p for p in member.filename.split("/")[:-1]
+                        if p not in ("", ".", "..")
+                    ]
+                    os.makedirs(os.path.join(extract_dir, *parts), exist_ok=True)
+                with ThreadPoolExecutor(max_workers=_IO_WORKERS) as pool:
+                    # list() re-raises the first extraction error, if any
+                    list(pool.map(
+                        lambda m: zf.extract(m, extract_dir),
+                        [m for m in members if not m.is_dir()],
+                    ))
+
+            # Find the actual root directory inside the zip
+            # (GitHub zips often have a single root folder)
+            entries = os.listdir(extract_dir)
+            if len(entries) == 1 and os.path.isdir(os.path.join(extract_dir, entries[0])):
+                source_dir = os.path.join(extract_dir, entries[0])
+            else:
+                source_dir = extract_dir
+
+            # 3. Preserve user data directories
+            preserve_dirs = {"config", "templates", "venv", ".git"}
+            preserve_files = set()
+
+            _log("🔄 파일 교체 중...")
+            # 4. Move new files over existing ones
+            moves = []
+            for root, dirs, files in os.walk(source_dir):
+                rel_root = os.path.relpath(root, source_dir)
+
+                # Skip preserved directories
+                dirs[:] = [d for d in dirs if d not in preserve_dirs]
+
+                for fname in files:
+                    rel_path = os.path.join(rel_root, fname) if rel_root != "." else fname
+                    src_file = os.path.join(root, fname)
+                    dst_file = os.path.join(app_dir, rel_path)
+
+                    # Create parent directories
+                    dst_parent = os.path.dirname(dst_file)
+                    os.makedirs(dst_parent, exist_ok=True)
+
+                    moves.append((src_file, dst_file))
+
+            # The extracted tree is discarded anyway, so rename instead of copying
+            for src_file, dst_file in moves:
+                _move_file(src_file, dst_file)
+        finally:
+            # 5. Cleanup temp files, whether or not the update went through
+            _remove_tree_async(tmp_dir)
 
         _log(f"✅ v{update_info.version} 업데이트 완료!")
         return True, f"v{update_info.version}으로 업데이트되었습니다.\n프로그램을 재시작해주세요."
@@ -208,7 +268,7 @@ def download_and_apply_async(
     Download and apply update in a background thread.
 
     Args:
-        update_info: UpdateInfo from check_update
+        update_info: UpdateInfo from parse_release
         app_dir: Current application directory
         callback: Called with (success, message) when done
         progress_callback: Called with status messages during download
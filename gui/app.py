@@ -2,26 +2,36 @@
 import sys
 import platform
 import os
+import threading
+from collections import deque
 
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QLabel, QPushButton, QFrame, QScrollArea, QTextEdit, QLineEdit,
     QMessageBox, QSizePolicy,
 )
-from PyQt6.QtCore import Qt, QTimer
-from PyQt6.QtGui import QFont, QColor
+from PyQt6.QtCore import Qt, QRect, QRectF, QTimer, QUrl, pyqtSignal, pyqtSlot
+from PyQt6.QtGui import QColor, QFont, QFontMetrics, QPainter
+from PyQt6.QtNetwork import QNetworkAccessManager, QNetworkReply, QNetworkRequest
 
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+_PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+_TEMPLATES_DIR = os.path.join(_PROJECT_ROOT, "templates")
+_CONFIG_PATH = os.path.join(_PROJECT_ROOT, "config", "tasks.json")
+
+sys.path.insert(0, _PROJECT_ROOT)
 
 from models.task import Task, TaskType, ActionType, TaskManager, MixGroup, ConditionType
 from core.monitor import MonitorEngine
 from gui.task_dialog import TaskDialog
 from gui.mix_dialog import MixGroupDialog
+from gui.task_labels import TYPE_EMOJI
 
-from core.updater import check_update_async, download_and_apply_async, UpdateInfo
+from core.updater import (
+    RELEASE_API_HEADERS, download_and_apply_async, parse_release,
+    release_api_url, UpdateInfo,
+)
 
 # Import version and config (robust: try import, then direct file load)
-_PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 try:
     from version_info import VERSION, GITHUB_REPO
 except ImportError:
@@ -42,6 +52,7 @@ except ImportError:
 _IS_WINDOWS = platform.system() == "Windows"
 _MONO_FONT = "Consolas" if _IS_WINDOWS else "Menlo"
 _MOD_KEY_LABEL = "Ctrl" if _IS_WINDOWS else "Cmd"
+_UI_FONT = "Segoe UI" if _IS_WINDOWS else "SF Pro Display"
 
 MAIN_STYLE = f"""
     /* ── Base ── */
@@ -49,23 +60,17 @@ MAIN_STYLE = f"""
         background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
             stop:0 #0d0d1a, stop:0.5 #131328, stop:1 #0a1628);
     }}
+    /* Every widget, labels and scroll area viewports included, is
+       transparent unless a more specific rule paints it */
     QWidget {{
         background: transparent;
         color: #e8e8f0;
         font-family: '{_MONO_FONT}', 'Segoe UI', system-ui;
     }}
-    QLabel {{
-        color: #e8e8f0;
-        background: transparent;
-    }}
 
     /* ── Glass panels ── */
     QScrollArea {{
         border: none;
-        background: transparent;
-    }}
-    QScrollArea > QWidget > QWidget {{
-        background: transparent;
     }}
     QScrollBar:vertical {{
         background: rgba(255,255,255,0.03);
@@ -111,219 +116,373 @@ MAIN_STYLE = f"""
 """
 
 
-class TaskCard(QFrame):
-    """Card widget for a single task — glassmorphism style."""
+def _pill_button_qss(name: str, start: str, end: str) -> str:
+    """Window stylesheet rules for a card pill button with objectName name."""
+    return f"""
+    QPushButton#{name} {{
+        background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
+            stop:0 {start}, stop:1 {end});
+        color: white; border: none; border-radius: 10px;
+        padding: 5px 0px; font-size: 11px; font-weight: 500;
+    }}
+    QPushButton#{name}:hover {{
+        background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
+            stop:0 {end}, stop:1 {start});
+    }}
+"""
 
-    def __init__(self, task: Task, parent_app):
+
+def _card_qss(name: str, rgb: str, bg_alpha: str, border_color: str) -> str:
+    """Window stylesheet rule for a card frame with objectName name."""
+    return f"""
+    QFrame#{name} {{
+        background: rgba({rgb}, {bg_alpha});
+        border: 1px solid {border_color};
+        border-radius: 14px;
+    }}
+"""
+
+
+# Card styles live in the window stylesheet, selected by objectName, so
+# cards carry no per-widget stylesheet for Qt to parse
+_CARD_STYLE = "".join([
+    _card_qss("taskCardOn", "255, 255, 255", "0.08", "rgba(100, 220, 140, 0.3)"),
+    _card_qss("taskCardOff", "255, 255, 255", "0.04", "rgba(255,255,255,0.06)"),
+    _card_qss("mixCardOn", "139, 92, 246", "0.08", "rgba(139, 92, 246, 0.35)"),
+    _card_qss("mixCardOff", "139, 92, 246", "0.04", "rgba(255,255,255,0.06)"),
+    _pill_button_qss("pillDisable", "#e67e22", "#d35400"),
+    _pill_button_qss("pillEnable", "#22c55e", "#16a34a"),
+    _pill_button_qss("pillEdit", "#6366f1", "#4f46e5"),
+    _pill_button_qss("pillEditMix", "#8b5cf6", "#7c3aed"),
+    _pill_button_qss("pillDelete", "#ef4444", "#dc2626"),
+])
+
+# Full window stylesheet, concatenated once at import
+_WINDOW_STYLE = MAIN_STYLE + _CARD_STYLE
+
+
+def _start_button_qss(start: str, end: str, hover_end: str) -> str:
+    return f"""
+        QPushButton {{
+            background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
+                stop:0 {start}, stop:1 {end});
+            color: white; border: none; border-radius: 12px;
+            padding: 11px 24px; font-size: 14px; font-weight: 600;
+        }}
+        QPushButton:hover {{
+            background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
+                stop:0 {end}, stop:1 {hover_end});
+        }}
+    """
+
+
+_START_BTN_QSS = _start_button_qss("#22c55e", "#16a34a", "#15803d")
+_STOP_BTN_QSS = _start_button_qss("#ef4444", "#dc2626", "#b91c1c")
+
+_STATUS_STOPPED_QSS = """
+    color: rgba(255, 107, 107, 0.9); font-size: 13px; font-weight: 500;
+    background: rgba(255, 107, 107, 0.08);
+    border: 1px solid rgba(255, 107, 107, 0.15);
+    border-radius: 12px; padding: 4px 14px;
+"""
+_STATUS_RUNNING_QSS = """
+    color: rgba(52, 211, 153, 0.95); font-size: 13px; font-weight: 500;
+    background: rgba(52, 211, 153, 0.08);
+    border: 1px solid rgba(52, 211, 153, 0.2);
+    border-radius: 12px; padding: 4px 14px;
+"""
+
+_UPDATE_BTN_QSS = """
+    QPushButton {
+        background: rgba(255,255,255,0.06); color: #8888aa;
+        border: 1px solid rgba(255,255,255,0.08);
+        border-radius: 10px; padding: 5px 12px; font-size: 11px;
+    }
+    QPushButton:hover {
+        background: rgba(255,255,255,0.1); color: #b0b0d0;
+    }
+"""
+_UPDATE_AVAILABLE_QSS = """
+    QPushButton {
+        background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
+            stop:0 #f59e0b, stop:1 #d97706);
+        color: white; border: none; border-radius: 10px;
+        padding: 5px 12px; font-size: 11px; font-weight: 600;
+    }
+    QPushButton:hover {
+        background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
+            stop:0 #d97706, stop:1 #b45309);
+    }
+"""
+
+
+_ACTION_NAMES = {
+    ActionType.CLICK: "클릭",
+    ActionType.DOUBLE_CLICK: "더블클릭",
+    ActionType.RIGHT_CLICK: "우클릭",
+}
+
+
+def _make_pill_button(text: str, name: str, width: int) -> QPushButton:
+    """Create a card button styled by the _CARD_STYLE rule for name."""
+    btn = QPushButton(text)
+    btn.setObjectName(name)
+    btn.setCursor(Qt.CursorShape.PointingHandCursor)
+    btn.setFixedSize(width, 26)
+    return btn
+
+
+def _set_style_name(widget: QWidget, name: str):
+    """Switch a widget to another objectName rule of the window stylesheet."""
+    if widget.objectName() == name:
+        return
+    widget.setObjectName(name)
+    # Selector matches are cached per widget until it is re-polished
+    widget.style().unpolish(widget)
+    widget.style().polish(widget)
+
+
+# Colors painted by _Card (accent bar, title and detail text)
+_ACCENT_OFF = QColor("#4a4a6a")
+_TITLE_ON = QColor("#f0f0ff")
+_TITLE_OFF = QColor("#777790")
+
+
+class _Card(QFrame):
+    """
+    Base for task list cards.
+
+    The frame background comes from the window stylesheet; the accent bar,
+    title and detail line are painted directly, so only the three pill
+    buttons are child widgets.
+    """
+
+    # Set by subclasses
+    _CARD_ON = _CARD_OFF = _EDIT_BUTTON = ""
+    _ACCENT_ON = _ACCENT_OFF
+    _DETAIL_COLOR = _TITLE_OFF
+
+    # Accent bar at x=16, 3 px wide, then a 10 px gap to the text
+    _TEXT_LEFT = 29
+    _TEXT_SPACING = 3
+
+    # (title font, detail font, title metrics, detail metrics), built on
+    # first paint since QFont needs the QApplication and the window font
+    _text_style = None
+
+    def __init__(self, parent_app, on_toggle, on_edit, on_delete):
+        """on_toggle, on_edit and on_delete are the pill buttons' slots."""
         super().__init__()
-        self.task = task
         self.app = parent_app
+        self._enabled: bool | None = None
+        self._accent_color = _ACCENT_OFF
+        self._title_color = _TITLE_OFF
+        self._title_text = ""
+        self._detail_text = ""
 
-        # Glass card with subtle border glow
-        border_color = "rgba(100, 220, 140, 0.3)" if self.task.enabled else "rgba(255,255,255,0.06)"
-        bg_alpha = "0.08" if self.task.enabled else "0.04"
-        self.setStyleSheet(f"""
-            TaskCard {{
-                background: rgba(255, 255, 255, {bg_alpha});
-                border: 1px solid {border_color};
-                border-radius: 14px;
-            }}
-        """)
         self.setFixedHeight(76)
-        self._build()
-
-    def _build(self):
         layout = QHBoxLayout(self)
         layout.setContentsMargins(16, 10, 14, 10)
         layout.setSpacing(10)
-
-        # Left accent bar
-        accent = QFrame()
-        accent_color = "#34d399" if self.task.enabled else "#4a4a6a"
-        accent.setFixedSize(3, 40)
-        accent.setStyleSheet(f"background: {accent_color}; border-radius: 2px;")
-        layout.addWidget(accent)
-
-        # Info section
-        left = QVBoxLayout()
-        left.setSpacing(3)
-        type_emoji = "🖼️" if self.task.task_type == TaskType.IMAGE else "📝"
-        name_color = "#f0f0ff" if self.task.enabled else "#777790"
-
-        title = QLabel(f"{type_emoji} {self.task.name}")
-        title.setStyleSheet(f"""
-            font-size: 14px; font-weight: 600; color: {name_color};
-            background: transparent;
-        """)
-        left.addWidget(title)
-
-        if self.task.task_type == TaskType.IMAGE:
-            detail = f"이미지 매칭 · 신뢰도 {self.task.confidence:.0%}"
-        else:
-            detail = f'텍스트: "{self.task.search_text}"'
-        action_names = {"click": "클릭", "double_click": "더블클릭", "right_click": "우클릭"}
-        detail += f"  →  {action_names.get(self.task.action.value, self.task.action.value)}"
-        detail += f"  ·  {self.task.cooldown:.1f}초"
-        if self.task.search_region:
-            detail += "  · 📐"
-        if self.task.auto_scroll:
-            detail += "  · 🔄"
-        if self.task.type_text:
-            detail += "  · ⌨️"
-
-        detail_label = QLabel(detail)
-        detail_label.setStyleSheet("font-size: 11px; color: #7a7a9a; background: transparent;")
-        left.addWidget(detail_label)
-        layout.addLayout(left, stretch=1)
+        # Painted text area
+        layout.addStretch(1)
 
         # Pill buttons
-        def make_btn(text, gradient_start, gradient_end, width=52):
-            btn = QPushButton(text)
-            btn.setStyleSheet(f"""
-                QPushButton {{
-                    background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
-                        stop:0 {gradient_start}, stop:1 {gradient_end});
-                    color: white; border: none; border-radius: 10px;
-                    padding: 5px 0px; font-size: 11px; font-weight: 500;
-                }}
-                QPushButton:hover {{
-                    background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
-                        stop:0 {gradient_end}, stop:1 {gradient_start});
-                }}
-            """)
-            btn.setCursor(Qt.CursorShape.PointingHandCursor)
-            btn.setFixedSize(width, 26)
-            return btn
-
-        toggle_text = "비활성" if self.task.enabled else "활성"
-        if self.task.enabled:
-            toggle_btn = make_btn(toggle_text, "#e67e22", "#d35400", 55)
-        else:
-            toggle_btn = make_btn(toggle_text, "#22c55e", "#16a34a", 55)
-        toggle_btn.clicked.connect(lambda: self.app._toggle_task(self.task.id))
-        layout.addWidget(toggle_btn)
+        self._toggle_btn = _make_pill_button("", "pillEnable", 55)
+        self._toggle_btn.clicked.connect(on_toggle)
+        layout.addWidget(self._toggle_btn)
 
-        edit_btn = make_btn("수정", "#6366f1", "#4f46e5", 48)
-        edit_btn.clicked.connect(lambda: self.app._edit_task(self.task))
+        edit_btn = _make_pill_button("수정", self._EDIT_BUTTON, 48)
+        edit_btn.clicked.connect(on_edit)
         layout.addWidget(edit_btn)
 
-        del_btn = make_btn("삭제", "#ef4444", "#dc2626", 48)
-        del_btn.clicked.connect(lambda: self.app._delete_task(self.task.id))
+        del_btn = _make_pill_button("삭제", "pillDelete", 48)
+        del_btn.clicked.connect(on_delete)
         layout.addWidget(del_btn)
 
+    def _set_enabled(self, enabled: bool):
+        # Styles are only re-resolved when the enabled state flips
+        if enabled == self._enabled:
+            return
+        self._enabled = enabled
+        _set_style_name(self, self._CARD_ON if enabled else self._CARD_OFF)
+        self._accent_color = self._ACCENT_ON if enabled else _ACCENT_OFF
+        self._title_color = _TITLE_ON if enabled else _TITLE_OFF
+        self._toggle_btn.setText("비활성" if enabled else "활성")
+        _set_style_name(self._toggle_btn, "pillDisable" if enabled else "pillEnable")
+        self.update()
+
+    def _set_text(self, title: str, detail: str):
+        if title != self._title_text or detail != self._detail_text:
+            self._title_text = title
+            self._detail_text = detail
+            self.update()
+
+    @staticmethod
+    def _get_text_style(base: QFont):
+        if _Card._text_style is None:
+            title_font = QFont(base)
+            title_font.setPixelSize(14)
+            title_font.setWeight(QFont.Weight.DemiBold)
+            detail_font = QFont(base)
+            detail_font.setPixelSize(11)
+            _Card._text_style = (
+                title_font, detail_font,
+                QFontMetrics(title_font), QFontMetrics(detail_font),
+            )
+        return _Card._text_style
+
+    def paintEvent(self, event):
+        # Stylesheet background and border first
+        super().paintEvent(event)
+        title_font, detail_font, title_fm, detail_fm = self._get_text_style(self.font())
+
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        height = self.height()
+
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(self._accent_color)
+        painter.drawRoundedRect(QRectF(16, (height - 40) / 2, 3, 40), 2, 2)
+
+        left = self._TEXT_LEFT
+        width = max(0, self._toggle_btn.x() - 10 - left)
+        align = Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter
+        top = (height - title_fm.height() - self._TEXT_SPACING - detail_fm.height()) // 2
+
+        painter.setFont(title_font)
+        painter.setPen(self._title_color)
+        painter.drawText(
+            QRect(left, top, width, title_fm.height()), align,
+            title_fm.elidedText(self._title_text, Qt.TextElideMode.ElideRight, width),
+        )
+        top += title_fm.height() + self._TEXT_SPACING
+        painter.setFont(detail_font)
+        painter.setPen(self._DETAIL_COLOR)
+        painter.drawText(
+            QRect(left, top, width, detail_fm.height()), align,
+            detail_fm.elidedText(self._detail_text, Qt.TextElideMode.ElideRight, width),
+        )
+        painter.end()
+
+
+class TaskCard(_Card):
+    """Card widget for a single task — glassmorphism style."""
+
+    _CARD_ON, _CARD_OFF = "taskCardOn", "taskCardOff"
+    _EDIT_BUTTON = "pillEdit"
+    _ACCENT_ON = QColor("#34d399")
+    _DETAIL_COLOR = QColor("#7a7a9a")
+
+    def __init__(self, task: Task, parent_app):
+        super().__init__(parent_app, self._on_toggle, self._on_edit, self._on_delete)
+        self.task = task
+        self._text_task: Task | None = None
+        self.update_from(task)
+
+    @pyqtSlot()
+    def _on_toggle(self):
+        self.app._toggle_task(self.task.id)
+
+    @pyqtSlot()
+    def _on_edit(self):
+        self.app._edit_task(self.task)
+
+    @pyqtSlot()
+    def _on_delete(self):
+        self.app._delete_task(self.task.id)
+
+    def update_from(self, task: Task):
+        """Show task's current state, reusing the existing child widgets."""
+        self.task = task
+        self._set_enabled(task.enabled)
+
+        # Edits replace the Task and toggles only flip enabled, so the same
+        # object always shows the same title and detail
+        if task is self._text_task:
+            return
+        self._text_task = task
+
+        title = f"{TYPE_EMOJI[task.task_type]} {task.name}"
+
+        if task.task_type == TaskType.IMAGE:
+            detail = f"이미지 매칭 · 신뢰도 {task.confidence:.0%}"
+        else:
+            detail = f'텍스트: "{task.search_text}"'
+        detail += f"  →  {_ACTION_NAMES[task.action]}"
+        detail += f"  ·  {task.cooldown:.1f}초"
+        if task.search_region:
+            detail += "  · 📐"
+        if task.auto_scroll:
+            detail += "  · 🔄"
+        if task.type_text:
+            detail += "  · ⌨️"
+        self._set_text(title, detail)
+
 
-class MixGroupCard(QFrame):
+class MixGroupCard(_Card):
     """Card widget for a MixGroup — distinct glass style."""
 
+    _CARD_ON, _CARD_OFF = "mixCardOn", "mixCardOff"
+    _EDIT_BUTTON = "pillEditMix"
+    _ACCENT_ON = QColor("#8b5cf6")
+    _DETAIL_COLOR = QColor("#8a7ab8")
+
     def __init__(self, group: MixGroup, parent_app):
-        super().__init__()
+        super().__init__(parent_app, self._on_toggle, self._on_edit, self._on_delete)
         self.group = group
-        self.app = parent_app
+        self.update_from(group)
 
-        border_color = "rgba(139, 92, 246, 0.35)" if group.enabled else "rgba(255,255,255,0.06)"
-        bg_alpha = "0.08" if group.enabled else "0.04"
-        self.setStyleSheet(f"""
-            MixGroupCard {{
-                background: rgba(139, 92, 246, {bg_alpha});
-                border: 1px solid {border_color};
-                border-radius: 14px;
-            }}
-        """)
-        self.setFixedHeight(76)
-        self._build()
+    @pyqtSlot()
+    def _on_toggle(self):
+        self.app._toggle_mix_group(self.group.id)
 
-    def _build(self):
-        layout = QHBoxLayout(self)
-        layout.setContentsMargins(16, 10, 14, 10)
-        layout.setSpacing(10)
+    @pyqtSlot()
+    def _on_edit(self):
+        self.app._edit_mix_group(self.group)
 
-        # Left accent bar (purple for mix)
-        accent = QFrame()
-        accent_color = "#8b5cf6" if self.group.enabled else "#4a4a6a"
-        accent.setFixedSize(3, 40)
-        accent.setStyleSheet(f"background: {accent_color}; border-radius: 2px;")
-        layout.addWidget(accent)
-
-        # Info section
-        left = QVBoxLayout()
-        left.setSpacing(3)
-        cond_badge = "AND" if self.group.condition == ConditionType.AND else "OR"
-        name_color = "#f0f0ff" if self.group.enabled else "#777790"
-
-        title = QLabel(f"🔀 {self.group.name}  [{cond_badge}]")
-        title.setStyleSheet(f"""
-            font-size: 14px; font-weight: 600; color: {name_color};
-            background: transparent;
-        """)
-        left.addWidget(title)
+    @pyqtSlot()
+    def _on_delete(self):
+        self.app._delete_mix_group(self.group.id)
+
+    def update_from(self, group: MixGroup):
+        """Show group's current state, reusing the existing child widgets."""
+        self.group = group
+        self._set_enabled(group.enabled)
+
+        cond_badge = "AND" if group.condition == ConditionType.AND else "OR"
+        title = f"🔀 {group.name}  [{cond_badge}]"
 
         # Show included task names
         task_names = []
-        for tid in self.group.task_ids:
+        for tid in group.task_ids:
             t = self.app.task_manager.get_task(tid)
             if t:
                 task_names.append(t.name)
         detail = " · ".join(task_names) if task_names else "작업 없음"
-        action_names = {"click": "클릭", "double_click": "더블클릭", "right_click": "우클릭"}
-        detail += f"  →  {action_names.get(self.group.action.value, self.group.action.value)}"
-
-        detail_label = QLabel(detail)
-        detail_label.setStyleSheet("font-size: 11px; color: #8a7ab8; background: transparent;")
-        left.addWidget(detail_label)
-        layout.addLayout(left, stretch=1)
-
-        # Pill buttons
-        def make_btn(text, gs, ge, width=52):
-            btn = QPushButton(text)
-            btn.setStyleSheet(f"""
-                QPushButton {{
-                    background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
-                        stop:0 {gs}, stop:1 {ge});
-                    color: white; border: none; border-radius: 10px;
-                    padding: 5px 0px; font-size: 11px; font-weight: 500;
-                }}
-                QPushButton:hover {{
-                    background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
-                        stop:0 {ge}, stop:1 {gs});
-                }}
-            """)
-            btn.setCursor(Qt.CursorShape.PointingHandCursor)
-            btn.setFixedSize(width, 26)
-            return btn
-
-        toggle_text = "비활성" if self.group.enabled else "활성"
-        if self.group.enabled:
-            toggle_btn = make_btn(toggle_text, "#e67e22", "#d35400", 55)
-        else:
-            toggle_btn = make_btn(toggle_text, "#22c55e", "#16a34a", 55)
-        toggle_btn.clicked.connect(lambda: self.app._toggle_mix_group(self.group.id))
-        layout.addWidget(toggle_btn)
-
-        edit_btn = make_btn("수정", "#8b5cf6", "#7c3aed", 48)
-        edit_btn.clicked.connect(lambda: self.app._edit_mix_group(self.group))
-        layout.addWidget(edit_btn)
-
-        del_btn = make_btn("삭제", "#ef4444", "#dc2626", 48)
-        del_btn.clicked.connect(lambda: self.app._delete_mix_group(self.group.id))
-        layout.addWidget(del_btn)
+        detail += f"  →  {_ACTION_NAMES[group.action]}"
+        self._set_text(title, detail)
 
 
 class ScreenAutomatorApp(QMainWindow):
     """Main application window."""
 
+    # Emitted when the first message of a new log batch is queued
+    _log_pending = pyqtSignal()
+    # Emitted from the hotkey listener thread to start/stop monitoring
+    _hotkey_pressed = pyqtSignal()
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle(f"🖱️ Screen Automator v{VERSION} — 화면 자동화")
         self.setMinimumSize(700, 650)
         self.resize(750, 700)
-        self.setStyleSheet(MAIN_STYLE)
+        self.setStyleSheet(_WINDOW_STYLE)
 
         # Data
-        config_path = os.path.join(
-            os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
-            "config", "tasks.json"
+        self.task_manager = TaskManager(
+            config_path=_CONFIG_PATH, error_callback=self._append_log
         )
-        self.task_manager = TaskManager(config_path=config_path)
         self.task_manager.load()
 
         self.monitor = MonitorEngine(
@@ -333,6 +492,17 @@ class ScreenAutomatorApp(QMainWindow):
         )
 
         self._pending_update: UpdateInfo | None = None
+        # Release checks run on the event loop, no worker thread needed
+        self._network = QNetworkAccessManager(self)
+        self._refresh_pending = False
+        # Dialogs are built on first use, then reset and reused
+        self._task_dialog: TaskDialog | None = None
+        self._mix_dialog: MixGroupDialog | None = None
+
+        # Log lines from any thread, flushed to log_text in batches
+        self._log_queue: deque[str] = deque()
+        self._log_lock = threading.Lock()
+        self._log_flush_scheduled = False
 
         self._build_ui()
         self._refresh_task_list()
@@ -346,6 +516,10 @@ class ScreenAutomatorApp(QMainWindow):
         main_layout.setContentsMargins(0, 0, 0, 0)
         main_layout.setSpacing(0)
 
+        # One QFont per style, shared by every label that uses it
+        title_font = QFont(_UI_FONT, 18, QFont.Weight.Bold)
+        section_font = QFont(_UI_FONT, 14, QFont.Weight.DemiBold)
+
         # ── Glass Header ──
         header = QFrame()
         header.setFixedHeight(64)
@@ -362,7 +536,8 @@ class ScreenAutomatorApp(QMainWindow):
         h_layout.setContentsMargins(24, 0, 24, 0)
 
         title = QLabel("⚡ Screen Automator")
-        title.setFont(QFont("Segoe UI" if _IS_WINDOWS else "SF Pro Display", 18, QFont.Weight.Bold))
+        title.setFont(title_font)
+        # QLabel is a QFrame, so header labels must opt out of its background
         title.setStyleSheet("color: #f0f0ff; background: transparent;")
         h_layout.addWidget(title)
 
@@ -376,50 +551,24 @@ class ScreenAutomatorApp(QMainWindow):
 
         # Update button
         self.update_btn = QPushButton("🔄 업데이트 확인")
-        self.update_btn.setStyleSheet("""
-            QPushButton {
-                background: rgba(255,255,255,0.06); color: #8888aa;
-                border: 1px solid rgba(255,255,255,0.08);
-                border-radius: 10px; padding: 5px 12px; font-size: 11px;
-            }
-            QPushButton:hover {
-                background: rgba(255,255,255,0.1); color: #b0b0d0;
-            }
-        """)
+        self.update_btn.setStyleSheet(_UPDATE_BTN_QSS)
         self.update_btn.setCursor(Qt.CursorShape.PointingHandCursor)
         self.update_btn.clicked.connect(self._on_update_btn_clicked)
         h_layout.addWidget(self.update_btn)
 
         self.status_label = QLabel("⏹ 정지됨")
-        self.status_label.setStyleSheet("""
-            color: rgba(255, 107, 107, 0.9); font-size: 13px; font-weight: 500;
-            background: rgba(255, 107, 107, 0.08);
-            border: 1px solid rgba(255, 107, 107, 0.15);
-            border-radius: 12px; padding: 4px 14px;
-        """)
+        self.status_label.setStyleSheet(_STATUS_STOPPED_QSS)
         h_layout.addWidget(self.status_label)
         main_layout.addWidget(header)
 
         # ── Controls ──
         controls = QFrame()
-        controls.setStyleSheet("background: transparent;")
         c_layout = QHBoxLayout(controls)
         c_layout.setContentsMargins(20, 14, 20, 8)
         c_layout.setSpacing(10)
 
         self.start_btn = QPushButton("▶  시작")
-        self.start_btn.setStyleSheet("""
-            QPushButton {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
-                    stop:0 #22c55e, stop:1 #16a34a);
-                color: white; border: none; border-radius: 12px;
-                padding: 11px 24px; font-size: 14px; font-weight: 600;
-            }
-            QPushButton:hover {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
-                    stop:0 #16a34a, stop:1 #15803d);
-            }
-        """)
+        self.start_btn.setStyleSheet(_START_BTN_QSS)
         self.start_btn.setCursor(Qt.CursorShape.PointingHandCursor)
         self.start_btn.clicked.connect(self._toggle_monitor)
         c_layout.addWidget(self.start_btn)
@@ -460,7 +609,7 @@ class ScreenAutomatorApp(QMainWindow):
         c_layout.addStretch()
 
         interval_label = QLabel("검사 간격")
-        interval_label.setStyleSheet("font-size: 12px; color: #8888aa; background: transparent;")
+        interval_label.setStyleSheet("font-size: 12px; color: #8888aa;")
         c_layout.addWidget(interval_label)
         self.interval_edit = QLineEdit("1.0")
         self.interval_edit.setFixedWidth(50)
@@ -468,7 +617,7 @@ class ScreenAutomatorApp(QMainWindow):
         self.interval_edit.returnPressed.connect(self._update_interval)
         c_layout.addWidget(self.interval_edit)
         sec_label = QLabel("초")
-        sec_label.setStyleSheet("font-size: 12px; color: #8888aa; background: transparent;")
+        sec_label.setStyleSheet("font-size: 12px; color: #8888aa;")
         c_layout.addWidget(sec_label)
         main_layout.addWidget(controls)
 
@@ -488,11 +637,11 @@ class ScreenAutomatorApp(QMainWindow):
         task_header = QHBoxLayout()
         task_header.setContentsMargins(24, 12, 24, 4)
         tl = QLabel("등록된 작업")
-        tl.setFont(QFont("Segoe UI" if _IS_WINDOWS else "SF Pro Display", 14, QFont.Weight.DemiBold))
-        tl.setStyleSheet("color: #c0c0e0; background: transparent;")
+        tl.setFont(section_font)
+        tl.setStyleSheet("color: #c0c0e0;")
         task_header.addWidget(tl)
         self.task_count_label = QLabel("0개")
-        self.task_count_label.setStyleSheet("color: #5a5a7a; font-size: 12px; background: transparent;")
+        self.task_count_label.setStyleSheet("color: #5a5a7a; font-size: 12px;")
         task_header.addWidget(self.task_count_label)
         task_header.addStretch()
         main_layout.addLayout(task_header)
@@ -500,11 +649,21 @@ class ScreenAutomatorApp(QMainWindow):
         # Scrollable task list
         scroll = QScrollArea()
         scroll.setWidgetResizable(True)
+        # Cards track the viewport width, so a horizontal bar never helps and
+        # its appearing/disappearing would force another layout pass
+        scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
         self.task_container = QWidget()
         self.task_layout = QVBoxLayout(self.task_container)
         self.task_layout.setAlignment(Qt.AlignmentFlag.AlignTop)
         self.task_layout.setContentsMargins(20, 4, 20, 8)
         self.task_layout.setSpacing(6)
+        self._empty_label = QLabel("등록된 작업이 없습니다\n위의 '작업 추가' 또는 '믹스 추가' 버튼을 눌러 시작하세요")
+        self._empty_label.setStyleSheet("color: #5a5a7a; font-size: 13px; padding: 40px;")
+        self._empty_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.task_layout.addWidget(self._empty_label)
+        # Card widgets by task / mix group id, reused across refreshes
+        self._task_cards: dict[str, TaskCard] = {}
+        self._mix_cards: dict[str, MixGroupCard] = {}
         scroll.setWidget(self.task_container)
         main_layout.addWidget(scroll, stretch=1)
 
@@ -518,8 +677,8 @@ class ScreenAutomatorApp(QMainWindow):
         log_header = QHBoxLayout()
         log_header.setContentsMargins(24, 10, 24, 4)
         ll = QLabel("실행 로그")
-        ll.setFont(QFont("Segoe UI" if _IS_WINDOWS else "SF Pro Display", 14, QFont.Weight.DemiBold))
-        ll.setStyleSheet("color: #c0c0e0; background: transparent;")
+        ll.setFont(section_font)
+        ll.setStyleSheet("color: #c0c0e0;")
         log_header.addWidget(ll)
         log_header.addStretch()
         clear_btn = QPushButton("지우기")
@@ -542,100 +701,167 @@ class ScreenAutomatorApp(QMainWindow):
         # Log text
         self.log_text = QTextEdit()
         self.log_text.setReadOnly(True)
+        # Append-only: drop the oldest lines past 1000 and keep no undo history
+        self.log_text.document().setMaximumBlockCount(1000)
+        self.log_text.setUndoRedoEnabled(False)
         self.log_text.setFixedHeight(150)
         main_layout.addWidget(self.log_text)
 
-    def _refresh_task_list(self):
-        # Clear existing
-        while self.task_layout.count():
-            item = self.task_layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
+        # Messages arriving within 50 ms go into one append
+        self._log_timer = QTimer(self)
+        self._log_timer.setSingleShot(True)
+        self._log_timer.setInterval(50)
+        self._log_timer.timeout.connect(self._flush_log)
+        self._log_pending.connect(
+            self._log_timer.start, Qt.ConnectionType.QueuedConnection
+        )
 
-        total = len(self.task_manager.tasks) + len(self.task_manager.mix_groups)
-        self.task_count_label.setText(f"{total}개")
+    def _request_refresh(self):
+        """
+        Schedule one _refresh_task_list for the next event loop turn.
 
-        if total == 0:
-            empty = QLabel("등록된 작업이 없습니다\n위의 '작업 추가' 또는 '믹스 추가' 버튼을 눌러 시작하세요")
-            empty.setStyleSheet("color: #5a5a7a; font-size: 13px; background: transparent; padding: 40px;")
-            empty.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.task_layout.addWidget(empty)
+        Several changes in a row (e.g. rapid toggles) then cost a single
+        refresh instead of one each.
+        """
+        if self._refresh_pending:
             return
+        self._refresh_pending = True
+        QTimer.singleShot(0, self._refresh_task_list)
 
-        # Individual tasks
-        for task in self.task_manager.tasks:
-            card = TaskCard(task, self)
-            self.task_layout.addWidget(card)
+    def _refresh_task_list(self):
+        """
+        Sync the card list with the task manager.
+
+        Existing cards are updated in place and only added or removed
+        tasks create or destroy widgets.
+        """
+        self._refresh_pending = False
+        tasks = self.task_manager.tasks
+        groups = self.task_manager.mix_groups
+        total = len(tasks) + len(groups)
+        self.task_count_label.setText(f"{total}개")
 
-        # Mix groups
-        for group in self.task_manager.mix_groups:
-            card = MixGroupCard(group, self)
-            self.task_layout.addWidget(card)
+        # Suspend painting so the batch of layout changes repaints once
+        self.task_container.setUpdatesEnabled(False)
+        try:
+            self._sync_cards(tasks, groups)
+            # The empty-state label stays last in the layout; hidden it takes no space
+            self._empty_label.setVisible(total == 0)
+        finally:
+            self.task_container.setUpdatesEnabled(True)
+            self.task_container.update()
+
+    def _sync_cards(self, tasks: list[Task], groups: list[MixGroup]):
+        """Create, update, remove and reorder cards to match tasks and groups."""
+        # Drop cards whose task or group is gone
+        for cards, items in ((self._task_cards, tasks), (self._mix_cards, groups)):
+            live_ids = {item.id for item in items}
+            for item_id in [i for i in cards if i not in live_ids]:
+                card = cards.pop(item_id)
+                self.task_layout.removeWidget(card)
+                card.deleteLater()
+
+        # Individual tasks first, then mix groups, in list order
+        index = 0
+        for cards, items, card_cls in (
+            (self._task_cards, tasks, TaskCard),
+            (self._mix_cards, groups, MixGroupCard),
+        ):
+            for item in items:
+                card = cards.get(item.id)
+                if card is None:
+                    card = cards[item.id] = card_cls(item, self)
+                else:
+                    card.update_from(item)
+                if self.task_layout.indexOf(card) != index:
+                    self.task_layout.removeWidget(card)
+                    self.task_layout.insertWidget(index, card)
+                index += 1
+
+    def _open_task_dialog(self, task: Task | None = None) -> TaskDialog:
+        """Return the shared TaskDialog, reset for task (None for a new one)."""
+        if self._task_dialog is None:
+            self._task_dialog = TaskDialog(self, templates_dir=_TEMPLATES_DIR, task=task)
+        else:
+            self._task_dialog.reset(task)
+        return self._task_dialog
 
     def _add_task(self):
-        templates_dir = os.path.join(
-            os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
-            "templates",
-        )
-        dialog = TaskDialog(self, templates_dir=templates_dir)
+        dialog = self._open_task_dialog()
         if dialog.exec() and dialog.result_task:
             self.task_manager.add_task(dialog.result_task)
-            self._refresh_task_list()
+            self._request_refresh()
             self._append_log(f"✅ 작업 추가됨: {dialog.result_task.name}")
 
     def _edit_task(self, task: Task):
-        templates_dir = os.path.join(
-            os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
-            "templates",
-        )
-        dialog = TaskDialog(self, templates_dir=templates_dir, task=task)
+        dialog = self._open_task_dialog(task)
         if dialog.exec() and dialog.result_task:
             self.task_manager.remove_task(task.id)
             self.task_manager.add_task(dialog.result_task)
-            self._refresh_task_list()
+            self._request_refresh()
             self._append_log(f"✏️ 작업 수정됨: {dialog.result_task.name}")
 
     def _delete_task(self, task_id: str):
         reply = QMessageBox.question(self, "삭제 확인", "이 작업을 삭제하시겠습니까?")
         if reply == QMessageBox.StandardButton.Yes:
             self.task_manager.remove_task(task_id)
-            self._refresh_task_list()
+            self._request_refresh()
             self._append_log("🗑️ 작업 삭제됨")
 
     def _toggle_task(self, task_id: str):
         self.task_manager.toggle_task(task_id)
-        self._refresh_task_list()
+        # Only this card changes; mix cards show task names, not state
+        card = self._task_cards.get(task_id)
+        task = self.task_manager.get_task(task_id)
+        if card is not None and task is not None:
+            card.update_from(task)
+        else:
+            self._request_refresh()
 
     # ── Mix Group Handlers ──
 
+    def _open_mix_dialog(self, group: MixGroup | None = None) -> MixGroupDialog:
+        """Return the shared MixGroupDialog, reset for group and the current tasks."""
+        tasks = self.task_manager.tasks
+        if self._mix_dialog is None:
+            self._mix_dialog = MixGroupDialog(self, tasks, group=group)
+        else:
+            self._mix_dialog.reset(tasks, group)
+        return self._mix_dialog
+
     def _add_mix_group(self):
         if not self.task_manager.tasks:
             QMessageBox.warning(self, "경고", "먼저 작업을 추가하세요.")
             return
-        dialog = MixGroupDialog(self, self.task_manager.tasks)
+        dialog = self._open_mix_dialog()
         if dialog.exec() and dialog.result_group:
             self.task_manager.add_mix_group(dialog.result_group)
-            self._refresh_task_list()
+            self._request_refresh()
             self._append_log(f"🔀 믹스 그룹 추가됨: {dialog.result_group.name}")
 
     def _edit_mix_group(self, group: MixGroup):
-        dialog = MixGroupDialog(self, self.task_manager.tasks, group=group)
+        dialog = self._open_mix_dialog(group)
         if dialog.exec() and dialog.result_group:
             self.task_manager.remove_mix_group(group.id)
             self.task_manager.add_mix_group(dialog.result_group)
-            self._refresh_task_list()
+            self._request_refresh()
             self._append_log(f"🔀 믹스 그룹 수정됨: {dialog.result_group.name}")
 
     def _delete_mix_group(self, group_id: str):
         reply = QMessageBox.question(self, "삭제 확인", "이 믹스 그룹을 삭제하시겠습니까?")
         if reply == QMessageBox.StandardButton.Yes:
             self.task_manager.remove_mix_group(group_id)
-            self._refresh_task_list()
+            self._request_refresh()
             self._append_log("🗑️ 믹스 그룹 삭제됨")
 
     def _toggle_mix_group(self, group_id: str):
         self.task_manager.toggle_mix_group(group_id)
-        self._refresh_task_list()
+        card = self._mix_cards.get(group_id)
+        group = self.task_manager.get_mix_group(group_id)
+        if card is not None and group is not None:
+            card.update_from(group)
+        else:
+            self._request_refresh()
 
     def _toggle_monitor(self):
         self._update_interval()
@@ -643,25 +869,9 @@ class ScreenAutomatorApp(QMainWindow):
         if self.monitor.is_running:
             self.monitor.stop()
             self.start_btn.setText("▶  시작")
-            self.start_btn.setStyleSheet("""
-                QPushButton {
-                    background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
-                        stop:0 #22c55e, stop:1 #16a34a);
-                    color: white; border: none; border-radius: 12px;
-                    padding: 11px 24px; font-size: 14px; font-weight: 600;
-                }
-                QPushButton:hover {
-                    background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
-                        stop:0 #16a34a, stop:1 #15803d);
-                }
-            """)
+            self.start_btn.setStyleSheet(_START_BTN_QSS)
             self.status_label.setText("⏹ 정지됨")
-            self.status_label.setStyleSheet("""
-                color: rgba(255, 107, 107, 0.9); font-size: 13px; font-weight: 500;
-                background: rgba(255, 107, 107, 0.08);
-                border: 1px solid rgba(255, 107, 107, 0.15);
-                border-radius: 12px; padding: 4px 14px;
-            """)
+            self.status_label.setStyleSheet(_STATUS_STOPPED_QSS)
         else:
             active = self.task_manager.get_active_tasks()
             if not active:
@@ -669,25 +879,9 @@ class ScreenAutomatorApp(QMainWindow):
                 return
             self.monitor.start()
             self.start_btn.setText("⏹  정지")
-            self.start_btn.setStyleSheet("""
-                QPushButton {
-                    background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
-                        stop:0 #ef4444, stop:1 #dc2626);
-                    color: white; border: none; border-radius: 12px;
-                    padding: 11px 24px; font-size: 14px; font-weight: 600;
-                }
-                QPushButton:hover {
-                    background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
-                        stop:0 #dc2626, stop:1 #b91c1c);
-                }
-            """)
+            self.start_btn.setStyleSheet(_STOP_BTN_QSS)
             self.status_label.setText("🟢 모니터링 중")
-            self.status_label.setStyleSheet("""
-                color: rgba(52, 211, 153, 0.95); font-size: 13px; font-weight: 500;
-                background: rgba(52, 211, 153, 0.08);
-                border: 1px solid rgba(52, 211, 153, 0.2);
-                border-radius: 12px; padding: 4px 14px;
-            """)
+            self.status_label.setStyleSheet(_STATUS_RUNNING_QSS)
 
     def _update_interval(self):
         try:
@@ -697,21 +891,43 @@ class ScreenAutomatorApp(QMainWindow):
             pass
 
     def _append_log(self, message: str):
-        QTimer.singleShot(0, lambda: self.log_text.append(message))
+        """Queue a log line; safe to call from any thread."""
+        with self._log_lock:
+            self._log_queue.append(message)
+            if self._log_flush_scheduled:
+                return
+            self._log_flush_scheduled = True
+        self._log_pending.emit()
+
+    def _flush_log(self):
+        with self._log_lock:
+            messages = "\n".join(self._log_queue)
+            self._log_queue.clear()
+            self._log_flush_scheduled = False
+        if messages:
+            self.log_text.append(messages)
 
     def _clear_log(self):
         self.log_text.clear()
 
     def _setup_hotkey(self):
+        self._hotkey_pressed.connect(
+            self._toggle_monitor, Qt.ConnectionType.QueuedConnection
+        )
+        # On Windows the OS matches the combo; pynput's listener sees every key
+        if _IS_WINDOWS:
+            try:
+                from gui.hotkey import WindowsHotkey
+                self._hotkey_listener = WindowsHotkey("S", self._hotkey_pressed.emit)
+                return
+            except Exception as e:
+                print(f"단축키 등록 실패, pynput으로 재시도: {e}")
         try:
             from pynput import keyboard
 
-            def on_activate():
-                QTimer.singleShot(0, self._toggle_monitor)
-
             hotkey_combo = "<ctrl>+<shift>+s" if _IS_WINDOWS else "<cmd>+<shift>+s"
             self._hotkey_listener = keyboard.GlobalHotKeys({
-                hotkey_combo: on_activate,
+                hotkey_combo: self._hotkey_pressed.emit,
             })
             self._hotkey_listener.start()
         except Exception as e:
@@ -723,29 +939,34 @@ class ScreenAutomatorApp(QMainWindow):
         """Check for updates in background on startup."""
         if not GITHUB_REPO or GITHUB_REPO.startswith("OWNER"):
             return
-        check_update_async(VERSION, GITHUB_REPO, self._on_update_check_done)
+        self._request_update_check(self._on_update_check_done)
+
+    def _request_update_check(self, on_done):
+        """Fetch the latest release; on_done gets UpdateInfo or None on the UI thread."""
+        req = QNetworkRequest(QUrl(release_api_url(GITHUB_REPO)))
+        for name, value in RELEASE_API_HEADERS.items():
+            req.setRawHeader(name.encode(), value.encode())
+        req.setTransferTimeout(10_000)
+        reply = self._network.get(req)
+        reply.finished.connect(lambda: self._on_release_reply(reply, on_done))
+
+    def _on_release_reply(self, reply: QNetworkReply, on_done):
+        reply.deleteLater()
+        update_info = None
+        if reply.error() == QNetworkReply.NetworkError.NoError:
+            update_info = parse_release(bytes(reply.readAll()), VERSION)
+        on_done(update_info)
 
     def _on_update_check_done(self, update_info):
-        """Called from background thread when update check completes."""
+        """Called when the startup update check completes."""
         if update_info:
             self._pending_update = update_info
-            QTimer.singleShot(0, lambda: self._show_update_available(update_info))
+            self._show_update_available(update_info)
 
     def _show_update_available(self, info: UpdateInfo):
         """Update the button style to indicate new version."""
         self.update_btn.setText(f"🆕 v{info.version} 업데이트")
-        self.update_btn.setStyleSheet("""
-            QPushButton {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
-                    stop:0 #f59e0b, stop:1 #d97706);
-                color: white; border: none; border-radius: 10px;
-                padding: 5px 12px; font-size: 11px; font-weight: 600;
-            }
-            QPushButton:hover {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
-                    stop:0 #d97706, stop:1 #b45309);
-            }
-        """)
+        self.update_btn.setStyleSheet(_UPDATE_AVAILABLE_QSS)
         self._append_log(f"🆕 새 버전 v{info.version}이 있습니다! 업데이트 버튼을 클릭하세요.")
 
     def _on_update_btn_clicked(self):
@@ -769,32 +990,25 @@ class ScreenAutomatorApp(QMainWindow):
                 return
             self.update_btn.setText("🔄 확인 중...")
             self.update_btn.setEnabled(False)
-            check_update_async(VERSION, GITHUB_REPO, self._on_manual_check_done)
+            self._request_update_check(self._on_manual_check_done)
 
     def _on_manual_check_done(self, update_info):
-        """Called from background thread after manual check."""
-        def _update_ui():
-            self.update_btn.setEnabled(True)
-            if update_info:
-                self._pending_update = update_info
-                self._show_update_available(update_info)
-            else:
-                self.update_btn.setText("✅ 최신 버전")
-                self._append_log("✅ 현재 최신 버전입니다.")
-                # Reset button after 3 seconds
-                QTimer.singleShot(3000, lambda: self.update_btn.setText("🔄 업데이트 확인"))
-        QTimer.singleShot(0, _update_ui)
+        """Called when a manual update check completes."""
+        self.update_btn.setEnabled(True)
+        if update_info:
+            self._pending_update = update_info
+            self._show_update_available(update_info)
+        else:
+            self.update_btn.setText("✅ 최신 버전")
+            self._append_log("✅ 현재 최신 버전입니다.")
+            # Reset button after 3 seconds
+            QTimer.singleShot(3000, lambda: self.update_btn.setText("🔄 업데이트 확인"))
 
     def _do_download_update(self):
         """Download and apply the pending update."""
         self.update_btn.setText("📥 다운로드 중...")
         self.update_btn.setEnabled(False)
 
-        app_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-
-        def on_progress(msg):
-            QTimer.singleShot(0, lambda: self._append_log(msg))
-
         def on_done(success, message):
             def _update_ui():
                 self.update_btn.setEnabled(True)
@@ -808,9 +1022,9 @@ class ScreenAutomatorApp(QMainWindow):
             QTimer.singleShot(0, _update_ui)
 
         download_and_apply_async(
-            self._pending_update, app_dir,
+            self._pending_update, _PROJECT_ROOT,
             callback=on_done,
-            progress_callback=on_progress,
+            progress_callback=self._append_log,
         )
 
     def closeEvent(self, event):
@@ -821,6 +1035,11 @@ class ScreenAutomatorApp(QMainWindow):
                 self._hotkey_listener.stop()
         except Exception:
             pass
+        try:
+            # Retries a delayed save that failed earlier
+            self.task_manager.flush()
+        except OSError as e:
+            QMessageBox.warning(self, "저장 실패", f"작업을 저장하지 못했습니다.\n{e}")
         event.accept()
 
 
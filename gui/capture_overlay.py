@@ -1,16 +1,52 @@
 """Screen region capture overlay using PyQt6."""
 import sys
+from PyQt6 import sip
 from PyQt6.QtWidgets import QWidget, QApplication, QLabel
-from PyQt6.QtCore import Qt, QRect, QPoint
-from PyQt6.QtGui import QPainter, QColor, QPen, QPixmap, QGuiApplication
+from PyQt6.QtCore import Qt, QRect, QRectF, QPoint, QThreadPool, QTimer, pyqtSignal
+from PyQt6.QtGui import QPainter, QColor, QPen, QPixmap, QImage, QGuiApplication
+import numpy as np
 from PIL import Image
 
 
+def _to_pil(qimg: QImage, source: QRect) -> Image.Image:
+    """
+    Convert the source rectangle of a screen grab to a PIL RGB image.
+
+    Screen grabs carry no useful alpha, so pixels are stored as 3-byte RGB.
+    Qt converts them in C++ straight into a fresh buffer that PIL wraps
+    without copying. qimg must already have a device pixel ratio of 1.0.
+    Safe to call from a worker thread.
+    """
+    w, h = source.width(), source.height()
+    # Keep scanlines 32-bit aligned, as QImage expects
+    stride = (w * 3 + 3) & ~3
+    buf = np.empty((h, stride), np.uint8)
+    # Wrapped through a raw pointer: a QImage over a Python buffer is
+    # read-only, and QPainter would draw into a detached copy instead
+    target = QImage(
+        sip.voidptr(buf.ctypes.data), w, h, stride, QImage.Format.Format_RGB888
+    )
+    painter = QPainter(target)
+    painter.setCompositionMode(QPainter.CompositionMode.CompositionMode_Source)
+    painter.drawImage(QPoint(0, 0), qimg, source)
+    painter.end()
+    return Image.frombuffer("RGB", (w, h), buf, "raw", "RGB", stride, 1)
+
+
 class CaptureOverlay(QWidget):
     """
     Full-screen transparent overlay for selecting a screen region.
     """
 
+    # (cropped PIL image, selection bbox) from the thread pool conversion
+    _cropped = pyqtSignal(object, object)
+
+    # Paint resources, built once instead of on every frame
+    _DIM = QColor(0, 0, 0, 100)
+    _BORDER_PEN = QPen(QColor(124, 58, 237), 2)  # Purple border
+    _TEXT_COLOR = QColor(255, 255, 255, 200)
+    _TEXT = "\n\n마우스를 드래그하여 캡처할 영역을 선택하세요 (ESC: 취소)"
+
     def __init__(self, callback=None):
         super().__init__()
         self.callback = callback
@@ -18,21 +54,30 @@ class CaptureOverlay(QWidget):
         self.end_pos = QPoint()
         self.is_selecting = False
         self.screenshot_pixmap = None
-        self.pil_screenshot = None
+        # Grab kept as a QImage; only the selected region becomes PIL pixels
+        self._qimg = None
+        # Screenshot at widget size x device pixel ratio, plain and dimmed
+        self._bright_pixmap = None
+        self._dim_pixmap = None
+        self._bg_size = None
+        # Drag repaints are batched to about one per display frame; this is
+        # the selection as last painted, or None when nothing is pending
+        self._painted_rect = None
+        self._repaint_timer = QTimer(self)
+        self._repaint_timer.setInterval(16)
+        self._repaint_timer.timeout.connect(self._flush_paint)
+        self._cropped.connect(self._on_cropped)
 
     def start(self):
         """Take screenshot and show overlay."""
         # Take screenshot before showing overlay
         screen = QGuiApplication.primaryScreen()
         if screen:
+            # The grab must happen on the GUI thread before the overlay shows
             self.screenshot_pixmap = screen.grabWindow(0)
-            # Convert to PIL
-            qimg = self.screenshot_pixmap.toImage()
-            width = qimg.width()
-            height = qimg.height()
-            ptr = qimg.bits()
-            ptr.setsize(height * width * 4)
-            self.pil_screenshot = Image.frombytes("RGBA", (width, height), bytes(ptr), "raw", "BGRA")
+            self._qimg = self.screenshot_pixmap.toImage()
+            # Converted pixel for pixel regardless of the device pixel ratio
+            self._qimg.setDevicePixelRatio(1.0)
 
         self.setWindowFlags(
             Qt.WindowType.FramelessWindowHint |
@@ -43,40 +88,68 @@ class CaptureOverlay(QWidget):
         self.setCursor(Qt.CursorShape.CrossCursor)
         self.showFullScreen()
 
-    def paintEvent(self, event):
-        painter = QPainter(self)
-        # Draw screenshot as background
+    def _prepare_backgrounds(self):
+        """Scale the screenshot to the widget once, and bake in the dimming."""
+        size = self.size()
+        if self._bg_size == size:
+            return
+        dpr = self.devicePixelRatioF()
+        bright = QPixmap(size * dpr)
+        bright.fill(QColor(0, 0, 0))
         if self.screenshot_pixmap:
-            painter.drawPixmap(0, 0, self.width(), self.height(), self.screenshot_pixmap)
+            if self.screenshot_pixmap.size() == bright.size():
+                bright = QPixmap(self.screenshot_pixmap)
+            else:
+                bright = self.screenshot_pixmap.scaled(
+                    bright.size(),
+                    Qt.AspectRatioMode.IgnoreAspectRatio,
+                    Qt.TransformationMode.SmoothTransformation,
+                )
+        bright.setDevicePixelRatio(dpr)
 
-        # Dark overlay
-        painter.fillRect(self.rect(), QColor(0, 0, 0, 100))
+        dim = QPixmap(bright)
+        painter = QPainter(dim)
+        painter.fillRect(QRect(QPoint(0, 0), size), self._DIM)
+        painter.end()
+
+        self._bright_pixmap = bright
+        self._dim_pixmap = dim
+        self._bg_size = size
+
+    @staticmethod
+    def _blit(painter: QPainter, pixmap: QPixmap, rect: QRect):
+        """Copy the part of a widget-sized background under rect, 1:1."""
+        dpr = pixmap.devicePixelRatio()
+        source_rect = QRectF(
+            rect.x() * dpr, rect.y() * dpr,
+            rect.width() * dpr, rect.height() * dpr,
+        )
+        painter.drawPixmap(QRectF(rect), pixmap, source_rect)
+
+    def paintEvent(self, event):
+        self._prepare_backgrounds()
+        painter = QPainter(self)
+        # Screenshot under the dark overlay, composed once per size; only
+        # the damaged region is copied
+        dirty = event.rect()
+        self._blit(painter, self._dim_pixmap, dirty)
 
         # Draw selection rectangle
         if self.is_selecting:
             rect = QRect(self.start_pos, self.end_pos).normalized()
             # Clear the selection area (show original screenshot)
-            if self.screenshot_pixmap:
-                sx = self.screenshot_pixmap.width() / self.width()
-                sy = self.screenshot_pixmap.height() / self.height()
-                source_rect = QRect(
-                    int(rect.x() * sx), int(rect.y() * sy),
-                    int(rect.width() * sx), int(rect.height() * sy)
-                )
-                painter.drawPixmap(rect, self.screenshot_pixmap, source_rect)
+            self._blit(painter, self._bright_pixmap, rect.intersected(dirty))
 
             # Selection border
-            pen = QPen(QColor(124, 58, 237), 2)  # Purple border
-            painter.setPen(pen)
+            painter.setPen(self._BORDER_PEN)
             painter.drawRect(rect)
 
         # Instructions
-        painter.setPen(QColor(255, 255, 255, 200))
-        painter.setFont(painter.font())
+        painter.setPen(self._TEXT_COLOR)
         painter.drawText(
             self.rect(),
             Qt.AlignmentFlag.AlignTop | Qt.AlignmentFlag.AlignHCenter,
-            "\n\n마우스를 드래그하여 캡처할 영역을 선택하세요 (ESC: 취소)"
+            self._TEXT,
         )
         painter.end()
 
@@ -85,17 +158,29 @@ class CaptureOverlay(QWidget):
             self.start_pos = event.pos()
             self.end_pos = event.pos()
             self.is_selecting = True
+            self._painted_rect = None
+            self._repaint_timer.start()
             self.update()
 
     def mouseMoveEvent(self, event):
         if self.is_selecting:
+            if self._painted_rect is None:
+                self._painted_rect = QRect(self.start_pos, self.end_pos).normalized()
             self.end_pos = event.pos()
-            self.update()
+
+    def _flush_paint(self):
+        if self._painted_rect is None:
+            return
+        new_rect = QRect(self.start_pos, self.end_pos).normalized()
+        # Repaint only the old and new selection, border included
+        self.update(self._painted_rect.united(new_rect).adjusted(-3, -3, 3, 3))
+        self._painted_rect = None
 
     def mouseReleaseEvent(self, event):
         if event.button() == Qt.MouseButton.LeftButton and self.is_selecting:
             self.end_pos = event.pos()
             self.is_selecting = False
+            self._repaint_timer.stop()
 
             rect = QRect(self.start_pos, self.end_pos).normalized()
 
@@ -106,19 +191,30 @@ class CaptureOverlay(QWidget):
                 return
 
             self.close()
-
-            if self.pil_screenshot and self.callback:
-                # Scale coordinates to actual screenshot size
-                sx = self.pil_screenshot.width / self.width()
-                sy = self.pil_screenshot.height / self.height()
-                crop_box = (
-                    int(rect.x() * sx),
-                    int(rect.y() * sy),
-                    int(rect.right() * sx),
-                    int(rect.bottom() * sy),
-                )
-                cropped = self.pil_screenshot.crop(crop_box)
-                self.callback(cropped, (rect.x(), rect.y(), rect.right(), rect.bottom()))
+            self._deliver(rect)
+
+    def _deliver(self, rect: QRect):
+        """Convert the selection to PIL and hand it to callback."""
+        if self._qimg is not None and self.callback:
+            # Scale coordinates to actual screenshot size
+            sx = self._qimg.width() / self.width()
+            sy = self._qimg.height() / self.height()
+            left, top = int(rect.x() * sx), int(rect.y() * sy)
+            source = QRect(
+                left, top,
+                int(rect.right() * sx) - left,
+                int(rect.bottom() * sy) - top,
+            )
+            bbox = (rect.x(), rect.y(), rect.right(), rect.bottom())
+            # Convert off the UI thread; the callback runs back on it
+            qimg = self._qimg
+            QThreadPool.globalInstance().start(
+                lambda: self._cropped.emit(_to_pil(qimg, source), bbox)
+            )
+
+    def _on_cropped(self, image, bbox):
+        if self.callback:
+            self.callback(image, bbox)
 
     def keyPressEvent(self, event):
         if event.key() == Qt.Key.Key_Escape:
@@ -0,0 +1,47 @@
+"""System-wide hotkey registered through the Windows message queue."""
+import ctypes
+from ctypes import wintypes
+from typing import Callable
+
+from PyQt6.QtCore import QAbstractNativeEventFilter, QCoreApplication
+
+_WM_HOTKEY = 0x0312
+_MOD_CONTROL = 0x0002
+_MOD_SHIFT = 0x0004
+_MOD_NOREPEAT = 0x4000
+
+# Qt hands thread messages and window messages to filters under these names
+_MSG_EVENT_TYPES = (b"windows_dispatcher_MSG", b"windows_generic_MSG")
+
+
+class WindowsHotkey(QAbstractNativeEventFilter):
+    """
+    Ctrl+Shift+<key> registered with RegisterHotKey.
+
+    Windows posts WM_HOTKEY to the GUI thread's queue only for the
+    registered combination, so nothing watches every keystroke.
+    Must be created on the GUI thread, after the QApplication.
+    """
+
+    def __init__(self, key: str, callback: Callable[[], None], hotkey_id: int = 1):
+        super().__init__()
+        self._callback = callback
+        self._id = hotkey_id
+        self._user32 = ctypes.windll.user32
+        modifiers = _MOD_CONTROL | _MOD_SHIFT | _MOD_NOREPEAT
+        if not self._user32.RegisterHotKey(None, hotkey_id, modifiers, ord(key.upper())):
+            raise ctypes.WinError()
+        QCoreApplication.instance().installNativeEventFilter(self)
+
+    def nativeEventFilter(self, event_type, message):
+        if bytes(event_type) in _MSG_EVENT_TYPES:
+            msg = wintypes.MSG.from_address(int(message))
+            if msg.message == _WM_HOTKEY and msg.wParam == self._id:
+                self._callback()
+                return True, 0
+        return False, 0
+
+    def stop(self):
+        """Unregister the hotkey and stop filtering messages."""
+        QCoreApplication.instance().removeNativeEventFilter(self)
+        self._user32.UnregisterHotKey(None, self._id)
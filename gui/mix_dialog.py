@@ -1,14 +1,16 @@
 """Dialog for creating and editing Mix Groups."""
-import uuid
+import secrets
 
 from PyQt6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit,
     QRadioButton, QButtonGroup, QPushButton, QFrame,
-    QMessageBox, QCheckBox, QScrollArea, QWidget,
+    QMessageBox, QListWidget, QListWidgetItem, QAbstractItemView,
 )
 from PyQt6.QtCore import Qt
+from PyQt6.QtGui import QColor
 
-from models.task import Task, TaskType, ActionType, ConditionType, MixGroup
+from models.task import Task, ActionType, ConditionType, MixGroup
+from gui.task_labels import TYPE_EMOJI, ACTION_BY_ID, ID_BY_ACTION
 
 
 STYLE = """
@@ -39,9 +41,17 @@ STYLE = """
             stop:0 #7c3aed, stop:1 #6d28d9);
         border: 2px solid rgba(124, 58, 237, 0.6);
     }
-    QCheckBox {
-        color: #c8c8e0; font-size: 12px; spacing: 8px; background: transparent;
+    QLabel#sectionTitle {
+        font-size: 13px; font-weight: 600; color: #a0a0c0; margin-top: 10px;
+    }
+    QListWidget {
+        border: 1px solid rgba(255,255,255,0.06); border-radius: 12px;
+        background: rgba(255,255,255,0.03); color: #c8c8e0;
+        font-size: 12px; padding: 8px 12px; outline: none;
     }
+    QListWidget::item { padding: 2px 0px; }
+    QScrollBar:vertical { background: transparent; width: 6px; }
+    QScrollBar::handle:vertical { background: rgba(255,255,255,0.15); border-radius: 3px; }
     QPushButton[class="primary"] {
         background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
             stop:0 #22c55e, stop:1 #16a34a);
@@ -68,24 +78,31 @@ class MixGroupDialog(QDialog):
 
     def __init__(self, parent, tasks: list[Task], group: MixGroup = None):
         super().__init__(parent)
-        self.setWindowTitle("믹스 그룹 추가" if group is None else "믹스 그룹 수정")
         self.setFixedSize(480, 560)
+        # The dialog is built once and reused, so STYLE is the only sheet
+        # it parses; child widgets are styled through its selectors
         self.setStyleSheet(STYLE)
 
-        self.all_tasks = tasks
+        self._build_ui()
+        self.reset(tasks, group)
+
+    def reset(self, tasks: list[Task], group: MixGroup = None):
+        """Clear the form for a new group, or fill it from group for editing."""
+        self.setWindowTitle("믹스 그룹 추가" if group is None else "믹스 그룹 수정")
         self.editing_group = group
         self.result_group = None
 
-        self._build_ui()
+        self.name_edit.clear()
+        self.radio_or.setChecked(True)
+        self.radio_click.setChecked(True)
+        self._set_tasks(tasks)
+
         if group:
             self._populate(group)
 
     def _title_label(self, text):
         lbl = QLabel(text)
-        lbl.setStyleSheet("""
-            font-size: 13px; font-weight: 600; color: #a0a0c0;
-            background: transparent; margin-top: 10px;
-        """)
+        lbl.setObjectName("sectionTitle")
         return lbl
 
     def _build_ui(self):
@@ -133,38 +150,11 @@ class MixGroupDialog(QDialog):
         # Task selection
         layout.addWidget(self._title_label("포함할 작업 선택"))
 
-        scroll = QScrollArea()
-        scroll.setWidgetResizable(True)
-        scroll.setStyleSheet("""
-            QScrollArea { border: 1px solid rgba(255,255,255,0.06); border-radius: 12px; background: rgba(255,255,255,0.03); }
-            QScrollBar:vertical { background: transparent; width: 6px; }
-            QScrollBar::handle:vertical { background: rgba(255,255,255,0.15); border-radius: 3px; }
-        """)
-        scroll.setFixedHeight(200)
-
-        task_container = QWidget()
-        task_container.setStyleSheet("background: transparent;")
-        task_layout = QVBoxLayout(task_container)
-        task_layout.setContentsMargins(12, 8, 12, 8)
-        task_layout.setSpacing(4)
-
-        self.task_checks: list[tuple[QCheckBox, str]] = []
-        if not self.all_tasks:
-            empty = QLabel("등록된 작업이 없습니다")
-            empty.setStyleSheet("color: #5a5a7a; font-size: 12px; background: transparent;")
-            empty.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            task_layout.addWidget(empty)
-        else:
-            for task in self.all_tasks:
-                type_emoji = "🖼️" if task.task_type == TaskType.IMAGE else "📝"
-                cb = QCheckBox(f"{type_emoji} {task.name}")
-                cb.setStyleSheet("background: transparent;")
-                self.task_checks.append((cb, task.id))
-                task_layout.addWidget(cb)
-
-        task_layout.addStretch()
-        scroll.setWidget(task_container)
-        layout.addWidget(scroll)
+        # Checkable list rows, not one QCheckBox widget per task
+        self.task_list = QListWidget()
+        self.task_list.setSelectionMode(QAbstractItemView.SelectionMode.NoSelection)
+        self.task_list.setFixedHeight(200)
+        layout.addWidget(self.task_list)
 
         layout.addStretch()
 
@@ -183,6 +173,33 @@ class MixGroupDialog(QDialog):
         btn_box.addWidget(save_btn)
         layout.addLayout(btn_box)
 
+    def _set_tasks(self, tasks: list[Task]):
+        """Replace the task rows with one checkable row per task in tasks."""
+        self.all_tasks = tasks
+        self.task_list.clear()
+
+        if not self.all_tasks:
+            empty = QListWidgetItem("등록된 작업이 없습니다")
+            empty.setFlags(Qt.ItemFlag.NoItemFlags)
+            empty.setForeground(QColor("#5a5a7a"))
+            empty.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
+            self.task_list.addItem(empty)
+            return
+
+        for task in self.all_tasks:
+            item = QListWidgetItem(f"{TYPE_EMOJI.get(task.task_type, '📝')} {task.name}")
+            item.setFlags(Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsUserCheckable)
+            item.setCheckState(Qt.CheckState.Unchecked)
+            item.setData(Qt.ItemDataRole.UserRole, task.id)
+            self.task_list.addItem(item)
+
+    def _task_items(self):
+        """Yield the list rows that stand for a task."""
+        for i in range(self.task_list.count()):
+            item = self.task_list.item(i)
+            if item.data(Qt.ItemDataRole.UserRole) is not None:
+                yield item
+
     def _populate(self, group: MixGroup):
         self.name_edit.setText(group.name)
         if group.condition == ConditionType.AND:
@@ -190,16 +207,12 @@ class MixGroupDialog(QDialog):
         else:
             self.radio_or.setChecked(True)
 
-        action_map = {
-            ActionType.CLICK: self.radio_click,
-            ActionType.DOUBLE_CLICK: self.radio_dblclick,
-            ActionType.RIGHT_CLICK: self.radio_rclick,
-        }
-        action_map.get(group.action, self.radio_click).setChecked(True)
+        self.action_group.button(ID_BY_ACTION.get(group.action, 0)).setChecked(True)
 
-        for cb, task_id in self.task_checks:
-            if task_id in group.task_ids:
-                cb.setChecked(True)
+        selected = frozenset(group.task_ids)
+        for item in self._task_items():
+            if item.data(Qt.ItemDataRole.UserRole) in selected:
+                item.setCheckState(Qt.CheckState.Checked)
 
     def _save(self):
         name = self.name_edit.text().strip()
@@ -207,20 +220,23 @@ class MixGroupDialog(QDialog):
             QMessageBox.warning(self, "경고", "그룹 이름을 입력하세요.")
             return
 
-        selected_ids = [tid for cb, tid in self.task_checks if cb.isChecked()]
+        selected_ids = [
+            item.data(Qt.ItemDataRole.UserRole) for item in self._task_items()
+            if item.checkState() == Qt.CheckState.Checked
+        ]
         if len(selected_ids) < 2:
             QMessageBox.warning(self, "경고", "2개 이상의 작업을 선택하세요.")
             return
 
         condition = ConditionType.AND if self.radio_and.isChecked() else ConditionType.OR
-        action_map = {0: ActionType.CLICK, 1: ActionType.DOUBLE_CLICK, 2: ActionType.RIGHT_CLICK}
-        action = action_map.get(self.action_group.checkedId(), ActionType.CLICK)
+        action_id = self.action_group.checkedId()
+        action = ACTION_BY_ID[action_id] if 0 <= action_id < len(ACTION_BY_ID) else ActionType.CLICK
 
         self.result_group = MixGroup(
             name=name,
             task_ids=selected_ids,
             condition=condition,
             action=action,
-            id=self.editing_group.id if self.editing_group else str(uuid.uuid4())[:8],
+            id=self.editing_group.id if self.editing_group else secrets.token_hex(4),
         )
         self.accept()
@@ -1,6 +1,9 @@
 """Task creation/editing dialog using PyQt6."""
+import functools
 import os
 import uuid
+from collections import OrderedDict
+from typing import TYPE_CHECKING
 
 from PyQt6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit,
@@ -8,11 +11,13 @@ from PyQt6.QtWidgets import (
     QMessageBox, QWidget, QCheckBox,
 )
 from PyQt6.QtCore import Qt, QTimer
-from PyQt6.QtGui import QPixmap, QImage, QGuiApplication
-from PIL import Image
+from PyQt6.QtGui import QPixmap, QImage, QImageReader, QGuiApplication
 
 from models.task import Task, TaskType, ActionType
-from gui.capture_overlay import CaptureOverlay
+from gui.task_labels import ACTION_BY_ID, ID_BY_ACTION
+
+if TYPE_CHECKING:
+    from PIL import Image
 
 
 STYLE = """
@@ -49,6 +54,12 @@ STYLE = """
         color: #c8c8e0; font-size: 12px; spacing: 8px;
         background: transparent;
     }
+    QLabel#sectionTitle {
+        font-size: 13px; font-weight: 600; color: #a0a0c0; margin-top: 10px;
+    }
+    QLabel#previewHint { color: #8888aa; }
+    QLabel#regionHint { color: #8888aa; font-size: 11px; }
+    QCheckBox#optionCheck { color: #e0e0e0; }
     QSlider::groove:horizontal {
         background: rgba(255,255,255,0.08); height: 6px; border-radius: 3px;
     }
@@ -61,7 +72,12 @@ STYLE = """
     QFrame[class="panel"] {
         background: rgba(255, 255, 255, 0.04);
         border: 1px solid rgba(255, 255, 255, 0.06);
-        border-radius: 12px;
+        border-radius: 12px; padding: 10px;
+    }
+    QFrame[class="panel-dark"] {
+        background-color: #2a2a3d;
+        border: 1px solid rgba(255, 255, 255, 0.06);
+        border-radius: 8px; padding: 10px;
     }
     QPushButton[class="primary"] {
         background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
@@ -93,34 +109,155 @@ STYLE = """
     }
 """
 
+_PREVIEW_PLACEHOLDER = "캡처된 이미지가 여기에 표시됩니다"
+_PREVIEW_SIZE = (400, 120)
+
+
+def _preview_pixmap(image: "Image.Image") -> QPixmap:
+    """Pixmap of a PIL template, shrunk by Qt to fit the preview box."""
+    # Captures are RGB; saved templates may be anything PIL can open
+    if image.mode != "RGB":
+        image = image.convert("RGBA")
+    fmt = QImage.Format.Format_RGB888 if image.mode == "RGB" else QImage.Format.Format_RGBA8888
+    data = image.tobytes()
+    qimage = QImage(data, image.width, image.height, len(data) // image.height, fmt)
+    pixmap = QPixmap.fromImage(qimage)
+    max_w, max_h = _PREVIEW_SIZE
+    # Like PIL's thumbnail, only ever shrink
+    if pixmap.width() > max_w or pixmap.height() > max_h:
+        pixmap = pixmap.scaled(
+            max_w, max_h,
+            Qt.AspectRatioMode.KeepAspectRatio,
+            Qt.TransformationMode.SmoothTransformation,
+        )
+    return pixmap
+
+
+def _format_region(r) -> str:
+    """Label text for a search region (x1, y1, x2, y2)."""
+    x1, y1, x2, y2 = r
+    return f"구역: ({x1}, {y1}) → ({x2}, {y2})  [{x2 - x1}×{y2 - y1}]"
+
+
+# (template path, mtime) -> preview pixmap, least recent first
+_template_cache: OrderedDict[tuple[str, float], QPixmap] = OrderedDict()
+_TEMPLATE_CACHE_SIZE = 64
+
+
+def _template_preview(path: str) -> QPixmap | None:
+    """
+    Preview of a saved template, decoded by Qt straight at preview size.
+
+    Reused until the file changes. Returns None if the file can't be read.
+    """
+    key = (path, os.path.getmtime(path))
+    pixmap = _template_cache.get(key)
+    if pixmap is not None:
+        _template_cache.move_to_end(key)
+        return pixmap
+    reader = QImageReader(path)
+    size = reader.size()
+    max_w, max_h = _PREVIEW_SIZE
+    # Like PIL's thumbnail, only ever shrink
+    if size.width() > max_w or size.height() > max_h:
+        reader.setScaledSize(size.scaled(max_w, max_h, Qt.AspectRatioMode.KeepAspectRatio))
+    image = reader.read()
+    if image.isNull():
+        return None
+    pixmap = _template_cache[key] = QPixmap.fromImage(image)
+    if len(_template_cache) > _TEMPLATE_CACHE_SIZE:
+        _template_cache.popitem(last=False)
+    return pixmap
+
 
 class TaskDialog(QDialog):
     def __init__(self, parent, templates_dir="templates", task=None):
         super().__init__(parent)
-        self.setWindowTitle("작업 추가" if task is None else "작업 수정")
         self.setFixedSize(500, 850)
+        # The dialog is built once and reused, so STYLE is parsed once;
+        # leaf widgets are styled through its selectors
         self.setStyleSheet(STYLE)
 
         self.templates_dir = templates_dir
         os.makedirs(templates_dir, exist_ok=True)
+        self._overlay = None
+
+        self._build_ui()
+        self.reset(task)
+
+    def reset(self, task=None):
+        """Clear the form for a new task, or fill it from task for editing."""
+        self.setWindowTitle("작업 추가" if task is None else "작업 수정")
         self.result_task = None
         self.captured_image = None
         self.editing_task = task
-        self._overlay = None
         self._captured_search_region = None  # (x1, y1, x2, y2) in screen coords
 
-        self._build_ui()
+        self.name_edit.clear()
+        self.radio_image.setChecked(True)
+        self.preview_label.clear()
+        self.preview_label.setText(_PREVIEW_PLACEHOLDER)
+        self.confidence_slider.setValue(80)
+        self.radio_click.setChecked(True)
+        self.cooldown_slider.setValue(30)
+        self.radio_fullscreen.setChecked(True)
+        self.scroll_check.setChecked(False)
+        self.type_check.setChecked(False)
+
+        # Panels that were never opened still hold their defaults
+        if self.text_panel is not None:
+            self.text_edit.clear()
+        if self.region_panel is not None:
+            self.region_label.setText("선택된 구역 없음")
+        if self.scroll_panel is not None:
+            self.scroll_slider.setValue(10)
+        if self.type_panel is not None:
+            self.type_text_edit.clear()
+            self.type_delay_slider.setValue(5)
+            self.enter_check.setChecked(True)
+
         if task:
             self._populate(task)
 
     def _title_label(self, text):
         lbl = QLabel(text)
-        lbl.setStyleSheet("""
-            font-size: 13px; font-weight: 600; color: #a0a0c0;
-            background: transparent; margin-top: 10px;
-        """)
+        lbl.setObjectName("sectionTitle")
         return lbl
 
+    def _radio_row(self, labels) -> tuple[QHBoxLayout, QButtonGroup, list[QRadioButton]]:
+        """Row of radio buttons with ids 0, 1, ... in order; the first starts checked."""
+        row = QHBoxLayout()
+        group = QButtonGroup(self)
+        buttons = []
+        for button_id, text in enumerate(labels):
+            button = QRadioButton(text)
+            group.addButton(button, button_id)
+            row.addWidget(button)
+            buttons.append(button)
+        buttons[0].setChecked(True)
+        row.addStretch()
+        return row, group, buttons
+
+    def _slider_row(self, caption, low, high, value, fmt, divisor=1) -> tuple[QHBoxLayout, QSlider, QLabel]:
+        """Optional caption, slider, and a label showing value / divisor as fmt."""
+        row = QHBoxLayout()
+        if caption:
+            row.addWidget(QLabel(caption))
+        slider = QSlider(Qt.Orientation.Horizontal)
+        slider.setRange(low, high)
+        slider.setValue(value)
+        row.addWidget(slider)
+        label = QLabel(fmt.format(value / divisor))
+        row.addWidget(label)
+        slider.valueChanged.connect(
+            functools.partial(self._update_scaled_label, label, fmt, divisor)
+        )
+        return row, slider, label
+
+    @staticmethod
+    def _update_scaled_label(label: QLabel, fmt: str, divisor: int, value: int):
+        label.setText(fmt.format(value / divisor))
+
     def _build_ui(self):
         layout = QVBoxLayout(self)
         layout.setSpacing(6)
@@ -134,23 +271,15 @@ class TaskDialog(QDialog):
 
         # Task type
         layout.addWidget(self._title_label("인식 모드"))
-        type_box = QHBoxLayout()
-        self.type_group = QButtonGroup(self)
-        self.radio_image = QRadioButton("🖼️ 이미지 인식")
-        self.radio_text = QRadioButton("📝 텍스트 인식 (OCR)")
-        self.radio_image.setChecked(True)
-        self.type_group.addButton(self.radio_image, 0)
-        self.type_group.addButton(self.radio_text, 1)
-        type_box.addWidget(self.radio_image)
-        type_box.addWidget(self.radio_text)
-        type_box.addStretch()
+        type_box, self.type_group, (self.radio_image, self.radio_text) = self._radio_row(
+            ("🖼️ 이미지 인식", "📝 텍스트 인식 (OCR)")
+        )
         layout.addLayout(type_box)
         self.type_group.idToggled.connect(self._on_type_change)
 
         # Image panel
         self.image_panel = QFrame()
-        self.image_panel.setProperty("class", "panel")
-        self.image_panel.setStyleSheet("background-color: #2a2a3d; border-radius: 8px; padding: 10px;")
+        self.image_panel.setProperty("class", "panel-dark")
         ip_layout = QVBoxLayout(self.image_panel)
         capture_btn = QPushButton("📷 화면 영역 캡처")
         capture_btn.setProperty("class", "capture")
@@ -158,161 +287,74 @@ class TaskDialog(QDialog):
         capture_btn.clicked.connect(self._do_capture)
         ip_layout.addWidget(capture_btn, alignment=Qt.AlignmentFlag.AlignCenter)
 
-        self.preview_label = QLabel("캡처된 이미지가 여기에 표시됩니다")
+        self.preview_label = QLabel(_PREVIEW_PLACEHOLDER)
         self.preview_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.preview_label.setStyleSheet("color: #8888aa;")
+        self.preview_label.setObjectName("previewHint")
         self.preview_label.setMinimumHeight(60)
         ip_layout.addWidget(self.preview_label)
 
         # Confidence
-        conf_box = QHBoxLayout()
-        conf_box.addWidget(QLabel("신뢰도:"))
-        self.confidence_slider = QSlider(Qt.Orientation.Horizontal)
-        self.confidence_slider.setRange(50, 100)
-        self.confidence_slider.setValue(80)
-        self.confidence_slider.setTickInterval(5)
-        conf_box.addWidget(self.confidence_slider)
-        self.conf_label = QLabel("0.80")
-        conf_box.addWidget(self.conf_label)
-        self.confidence_slider.valueChanged.connect(
-            lambda v: self.conf_label.setText(f"{v/100:.2f}")
+        conf_box, self.confidence_slider, self.conf_label = self._slider_row(
+            "신뢰도:", 50, 100, 80, "{:.2f}", 100
         )
+        self.confidence_slider.setTickInterval(5)
         ip_layout.addLayout(conf_box)
         layout.addWidget(self.image_panel)
 
-        # Text panel
-        self.text_panel = QFrame()
-        self.text_panel.setProperty("class", "panel")
-        self.text_panel.setStyleSheet("background-color: #2a2a3d; border-radius: 8px; padding: 10px;")
-        tp_layout = QVBoxLayout(self.text_panel)
-        tp_layout.addWidget(QLabel("찾을 텍스트:"))
-        self.text_edit = QLineEdit()
-        self.text_edit.setPlaceholderText("예: 확인, OK, 계속")
-        tp_layout.addWidget(self.text_edit)
-        layout.addWidget(self.text_panel)
-        self.text_panel.hide()
+        # Text panel, built on first use
+        self.text_panel = None
+        self._text_slot = QVBoxLayout()
+        layout.addLayout(self._text_slot)
 
         # Action
         layout.addWidget(self._title_label("수행할 동작"))
-        action_box = QHBoxLayout()
-        self.action_group = QButtonGroup(self)
-        self.radio_click = QRadioButton("클릭")
-        self.radio_dblclick = QRadioButton("더블클릭")
-        self.radio_rclick = QRadioButton("우클릭")
-        self.radio_click.setChecked(True)
-        self.action_group.addButton(self.radio_click, 0)
-        self.action_group.addButton(self.radio_dblclick, 1)
-        self.action_group.addButton(self.radio_rclick, 2)
-        action_box.addWidget(self.radio_click)
-        action_box.addWidget(self.radio_dblclick)
-        action_box.addWidget(self.radio_rclick)
-        action_box.addStretch()
+        action_box, self.action_group, (
+            self.radio_click, self.radio_dblclick, self.radio_rclick,
+        ) = self._radio_row(("클릭", "더블클릭", "우클릭"))
         layout.addLayout(action_box)
 
         # Cooldown
         layout.addWidget(self._title_label("재클릭 대기 시간"))
-        cd_box = QHBoxLayout()
-        self.cooldown_slider = QSlider(Qt.Orientation.Horizontal)
-        self.cooldown_slider.setRange(5, 100)  # 0.5 to 10.0 (x10)
-        self.cooldown_slider.setValue(30)
-        cd_box.addWidget(self.cooldown_slider)
-        self.cd_label = QLabel("3.0초")
-        cd_box.addWidget(self.cd_label)
-        self.cooldown_slider.valueChanged.connect(
-            lambda v: self.cd_label.setText(f"{v/10:.1f}초")
+        # 0.5 to 10.0 seconds (x10)
+        cd_box, self.cooldown_slider, self.cd_label = self._slider_row(
+            None, 5, 100, 30, "{:.1f}초", 10
         )
         layout.addLayout(cd_box)
 
         # ── Search Region ──
         layout.addWidget(self._title_label("검색 구역"))
-        region_box = QHBoxLayout()
-        self.region_group = QButtonGroup(self)
-        self.radio_fullscreen = QRadioButton("🖥️ 풀스크린")
-        self.radio_region = QRadioButton("📐 구역 지정")
-        self.radio_fullscreen.setChecked(True)
-        self.region_group.addButton(self.radio_fullscreen, 0)
-        self.region_group.addButton(self.radio_region, 1)
-        region_box.addWidget(self.radio_fullscreen)
-        region_box.addWidget(self.radio_region)
-        region_box.addStretch()
+        region_box, self.region_group, (self.radio_fullscreen, self.radio_region) = self._radio_row(
+            ("🖥️ 풀스크린", "📐 구역 지정")
+        )
         layout.addLayout(region_box)
 
-        self.region_panel = QFrame()
-        self.region_panel.setStyleSheet("background: rgba(255,255,255,0.04); border: 1px solid rgba(255,255,255,0.06); border-radius: 12px; padding: 10px;")
-        rp_layout = QVBoxLayout(self.region_panel)
-        region_capture_btn = QPushButton("📐 검색 구역 선택")
-        region_capture_btn.setProperty("class", "capture")
-        region_capture_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        region_capture_btn.clicked.connect(self._do_region_capture)
-        rp_layout.addWidget(region_capture_btn, alignment=Qt.AlignmentFlag.AlignCenter)
-        self.region_label = QLabel("선택된 구역 없음")
-        self.region_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.region_label.setStyleSheet("color: #8888aa; font-size: 11px;")
-        rp_layout.addWidget(self.region_label)
-        layout.addWidget(self.region_panel)
-        self.region_panel.hide()
+        self.region_panel = None
+        self._region_slot = QVBoxLayout()
+        layout.addLayout(self._region_slot)
 
         self.region_group.idToggled.connect(self._on_region_change)
 
         # ── Auto Scroll ──
         layout.addWidget(self._title_label("자동 스크롤"))
         self.scroll_check = QCheckBox("🔄 대상을 못 찾으면 자동 스크롤 후 재검색")
-        self.scroll_check.setStyleSheet("color: #e0e0e0; font-size: 12px;")
+        self.scroll_check.setObjectName("optionCheck")
         layout.addWidget(self.scroll_check)
 
-        self.scroll_panel = QFrame()
-        self.scroll_panel.setStyleSheet("background: rgba(255,255,255,0.04); border: 1px solid rgba(255,255,255,0.06); border-radius: 12px; padding: 10px;")
-        sp_layout = QHBoxLayout(self.scroll_panel)
-        sp_layout.addWidget(QLabel("최대 스크롤 횟수:"))
-        self.scroll_slider = QSlider(Qt.Orientation.Horizontal)
-        self.scroll_slider.setRange(1, 30)
-        self.scroll_slider.setValue(10)
-        sp_layout.addWidget(self.scroll_slider)
-        self.scroll_count_label = QLabel("10회")
-        sp_layout.addWidget(self.scroll_count_label)
-        self.scroll_slider.valueChanged.connect(
-            lambda v: self.scroll_count_label.setText(f"{v}회")
-        )
-        layout.addWidget(self.scroll_panel)
-        self.scroll_panel.hide()
+        self.scroll_panel = None
+        self._scroll_slot = QVBoxLayout()
+        layout.addLayout(self._scroll_slot)
 
         self.scroll_check.toggled.connect(self._on_scroll_toggle)
 
         # ── Type Text After Click ──
         layout.addWidget(self._title_label("클릭 후 텍스트 입력"))
         self.type_check = QCheckBox("⌨️ 클릭 후 텍스트 자동 입력")
-        self.type_check.setStyleSheet("color: #e0e0e0; font-size: 12px;")
+        self.type_check.setObjectName("optionCheck")
         layout.addWidget(self.type_check)
 
-        self.type_panel = QFrame()
-        self.type_panel.setStyleSheet("background: rgba(255,255,255,0.04); border: 1px solid rgba(255,255,255,0.06); border-radius: 12px; padding: 10px;")
-        tp2_layout = QVBoxLayout(self.type_panel)
-
-        tp2_layout.addWidget(QLabel("입력할 텍스트:"))
-        self.type_text_edit = QLineEdit()
-        self.type_text_edit.setPlaceholderText("예: Hello World, 검색어 등")
-        tp2_layout.addWidget(self.type_text_edit)
-
-        delay_box = QHBoxLayout()
-        delay_box.addWidget(QLabel("입력 대기 시간:"))
-        self.type_delay_slider = QSlider(Qt.Orientation.Horizontal)
-        self.type_delay_slider.setRange(3, 30)  # 0.3 to 3.0 (x10)
-        self.type_delay_slider.setValue(5)
-        delay_box.addWidget(self.type_delay_slider)
-        self.type_delay_label = QLabel("0.5초")
-        delay_box.addWidget(self.type_delay_label)
-        self.type_delay_slider.valueChanged.connect(
-            lambda v: self.type_delay_label.setText(f"{v/10:.1f}초")
-        )
-        tp2_layout.addLayout(delay_box)
-
-        self.enter_check = QCheckBox("입력 후 Enter 키 누르기")
-        self.enter_check.setChecked(True)
-        self.enter_check.setStyleSheet("color: #c8c8e0; font-size: 12px;")
-        tp2_layout.addWidget(self.enter_check)
-
-        layout.addWidget(self.type_panel)
-        self.type_panel.hide()
+        self.type_panel = None
+        self._type_slot = QVBoxLayout()
+        layout.addLayout(self._type_slot)
 
         self.type_check.toggled.connect(self._on_type_toggle)
 
@@ -333,47 +375,128 @@ class TaskDialog(QDialog):
         btn_box.addWidget(cancel_btn)
         layout.addLayout(btn_box)
 
+    # Optional panels are only built the first time they are shown; the
+    # widgets inside them exist only once their panel does.
+
+    def _ensure_text_panel(self):
+        if self.text_panel is not None:
+            return
+        self.text_panel = QFrame()
+        self.text_panel.setProperty("class", "panel-dark")
+        tp_layout = QVBoxLayout(self.text_panel)
+        tp_layout.addWidget(QLabel("찾을 텍스트:"))
+        self.text_edit = QLineEdit()
+        self.text_edit.setPlaceholderText("예: 확인, OK, 계속")
+        tp_layout.addWidget(self.text_edit)
+        self._text_slot.addWidget(self.text_panel)
+
+    def _ensure_region_panel(self):
+        if self.region_panel is not None:
+            return
+        self.region_panel = QFrame()
+        self.region_panel.setProperty("class", "panel")
+        rp_layout = QVBoxLayout(self.region_panel)
+        region_capture_btn = QPushButton("📐 검색 구역 선택")
+        region_capture_btn.setProperty("class", "capture")
+        region_capture_btn.setCursor(Qt.CursorShape.PointingHandCursor)
+        region_capture_btn.clicked.connect(self._do_region_capture)
+        rp_layout.addWidget(region_capture_btn, alignment=Qt.AlignmentFlag.AlignCenter)
+        self.region_label = QLabel("선택된 구역 없음")
+        self.region_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.region_label.setObjectName("regionHint")
+        rp_layout.addWidget(self.region_label)
+        self._region_slot.addWidget(self.region_panel)
+
+    def _ensure_scroll_panel(self):
+        if self.scroll_panel is not None:
+            return
+        self.scroll_panel = QFrame()
+        self.scroll_panel.setProperty("class", "panel")
+        sp_layout, self.scroll_slider, self.scroll_count_label = self._slider_row(
+            "최대 스크롤 횟수:", 1, 30, 10, "{:.0f}회"
+        )
+        self.scroll_panel.setLayout(sp_layout)
+        self._scroll_slot.addWidget(self.scroll_panel)
+
+    def _ensure_type_panel(self):
+        if self.type_panel is not None:
+            return
+        self.type_panel = QFrame()
+        self.type_panel.setProperty("class", "panel")
+        tp2_layout = QVBoxLayout(self.type_panel)
+
+        tp2_layout.addWidget(QLabel("입력할 텍스트:"))
+        self.type_text_edit = QLineEdit()
+        self.type_text_edit.setPlaceholderText("예: Hello World, 검색어 등")
+        tp2_layout.addWidget(self.type_text_edit)
+
+        # 0.3 to 3.0 seconds (x10)
+        delay_box, self.type_delay_slider, self.type_delay_label = self._slider_row(
+            "입력 대기 시간:", 3, 30, 5, "{:.1f}초", 10
+        )
+        tp2_layout.addLayout(delay_box)
+
+        self.enter_check = QCheckBox("입력 후 Enter 키 누르기")
+        self.enter_check.setChecked(True)
+        tp2_layout.addWidget(self.enter_check)
+
+        self._type_slot.addWidget(self.type_panel)
+
     def _on_type_change(self, id, checked):
         if not checked:
             return
         if id == 0:  # image
             self.image_panel.show()
-            self.text_panel.hide()
+            if self.text_panel is not None:
+                self.text_panel.hide()
         else:  # text
             self.image_panel.hide()
+            self._ensure_text_panel()
             self.text_panel.show()
 
     def _on_region_change(self, id, checked):
         if not checked:
             return
         if id == 1:  # custom region
+            self._ensure_region_panel()
             self.region_panel.show()
         else:  # fullscreen
-            self.region_panel.hide()
             self._captured_search_region = None
-            self.region_label.setText("선택된 구역 없음")
+            if self.region_panel is not None:
+                self.region_panel.hide()
+                self.region_label.setText("선택된 구역 없음")
 
     def _on_scroll_toggle(self, checked):
-        self.scroll_panel.setVisible(checked)
+        if checked:
+            self._ensure_scroll_panel()
+        if self.scroll_panel is not None:
+            self.scroll_panel.setVisible(checked)
 
     def _on_type_toggle(self, checked):
-        self.type_panel.setVisible(checked)
+        if checked:
+            self._ensure_type_panel()
+        if self.type_panel is not None:
+            self.type_panel.setVisible(checked)
 
     def _do_capture(self):
         self.hide()
         QTimer.singleShot(300, self._start_capture)
 
-    def _start_capture(self):
-        self._overlay = CaptureOverlay(callback=self._on_capture_done)
+    def _start_overlay(self, callback):
+        # Imported on first capture; the overlay pulls in numpy and PIL
+        from gui.capture_overlay import CaptureOverlay
+        self._overlay = CaptureOverlay(callback=callback)
         self._overlay.start()
 
+    def _start_capture(self):
+        self._start_overlay(self._on_capture_done)
+
     def _do_region_capture(self):
         self.hide()
         QTimer.singleShot(300, self._start_region_capture)
 
     def _start_region_capture(self):
-        self._overlay = CaptureOverlay(callback=self._on_region_capture_done)
-        self._overlay.start()
+        self._start_overlay(self._on_region_capture_done)
 
     def _on_capture_done(self, image, bbox):
         self.show()
@@ -381,36 +504,22 @@ class TaskDialog(QDialog):
         if image is None:
             return
         self.captured_image = image
-        # Show preview
-        preview = image.copy()
-        preview.thumbnail((400, 120))
-        qimage = QImage(
-            preview.tobytes("raw", "RGBA"), preview.width, preview.height,
-            QImage.Format.Format_RGBA8888,
-        )
-        pixmap = QPixmap.fromImage(qimage)
-        self.preview_label.setPixmap(pixmap)
+        self.preview_label.setPixmap(_preview_pixmap(image))
 
     def _on_region_capture_done(self, image, bbox):
         self.show()
         self.raise_()
         if image is None or bbox is None:
             return
-        # bbox is in widget coords, scale to actual screen pixels
+        # bbox = (x1, y1, x2, y2) in widget coords; scale to actual screen
+        # pixels by the device pixel ratio (typically 1.0 or 2.0)
         screen = QGuiApplication.primaryScreen()
-        if screen:
-            geom = screen.geometry()
-            ratio = screen.devicePixelRatio()
-            sx = (geom.width() * ratio) / geom.width()  # typically 1.0 or 2.0
-            # bbox = (x1_widget, y1_widget, x2_widget, y2_widget)
-            self._captured_search_region = (
-                int(bbox[0] * sx), int(bbox[1] * sx),
-                int(bbox[2] * sx), int(bbox[3] * sx),
-            )
-        else:
-            self._captured_search_region = (int(bbox[0]), int(bbox[1]), int(bbox[2]), int(bbox[3]))
-        r = self._captured_search_region
-        self.region_label.setText(f"구역: ({r[0]}, {r[1]}) → ({r[2]}, {r[3]})  [{r[2]-r[0]}×{r[3]-r[1]}]")
+        ratio = screen.devicePixelRatio() if screen else 1.0
+        x1, y1, x2, y2 = bbox
+        self._captured_search_region = (
+            int(x1 * ratio), int(y1 * ratio), int(x2 * ratio), int(y2 * ratio),
+        )
+        self.region_label.setText(_format_region(self._captured_search_region))
 
     def _populate(self, task):
         self.name_edit.setText(task.name)
@@ -423,31 +532,23 @@ class TaskDialog(QDialog):
         self.confidence_slider.setValue(int(task.confidence * 100))
         self.cooldown_slider.setValue(int(task.cooldown * 10))
 
-        action_map = {ActionType.CLICK: self.radio_click,
-                      ActionType.DOUBLE_CLICK: self.radio_dblclick,
-                      ActionType.RIGHT_CLICK: self.radio_rclick}
-        action_map.get(task.action, self.radio_click).setChecked(True)
+        self.action_group.button(ID_BY_ACTION.get(task.action, 0)).setChecked(True)
 
         if task.task_type == TaskType.IMAGE and task.template_path:
+            # The template file is kept as is unless a new capture replaces
+            # it, so only the preview is decoded here
             try:
-                img = Image.open(task.template_path)
-                self.captured_image = img
-                preview = img.copy()
-                preview.thumbnail((400, 120))
-                qimage = QImage(
-                    preview.tobytes("raw", "RGBA"), preview.width, preview.height,
-                    QImage.Format.Format_RGBA8888,
-                )
-                self.preview_label.setPixmap(QPixmap.fromImage(qimage))
-            except Exception:
-                pass
+                pixmap = _template_preview(task.template_path)
+            except OSError:
+                pixmap = None
+            if pixmap is not None:
+                self.preview_label.setPixmap(pixmap)
 
         # Search region
         if task.search_region:
             self.radio_region.setChecked(True)
             self._captured_search_region = task.search_region
-            r = task.search_region
-            self.region_label.setText(f"구역: ({r[0]}, {r[1]}) → ({r[2]}, {r[3]})  [{r[2]-r[0]}×{r[3]-r[1]}]")
+            self.region_label.setText(_format_region(task.search_region))
 
         # Auto scroll
         if task.auto_scroll:
@@ -468,8 +569,8 @@ class TaskDialog(QDialog):
             return
 
         task_type = TaskType.IMAGE if self.radio_image.isChecked() else TaskType.TEXT
-        action_map = {0: ActionType.CLICK, 1: ActionType.DOUBLE_CLICK, 2: ActionType.RIGHT_CLICK}
-        action = action_map.get(self.action_group.checkedId(), ActionType.CLICK)
+        action_id = self.action_group.checkedId()
+        action = ACTION_BY_ID[action_id] if 0 <= action_id < len(ACTION_BY_ID) else ActionType.CLICK
 
         template_path = None
         search_text = None
@@ -0,0 +1,9 @@
+"""Task display and form tables shared by the main window and dialogs."""
+from models.task import TaskType, ActionType
+
+# Prefix shown before a task's name, per task type
+TYPE_EMOJI = {TaskType.IMAGE: "🖼️", TaskType.TEXT: "📝"}
+
+# Action per action radio button id (click, double-click, right-click), and the reverse
+ACTION_BY_ID = (ActionType.CLICK, ActionType.DOUBLE_CLICK, ActionType.RIGHT_CLICK)
+ID_BY_ACTION = {action: i for i, action in enumerate(ACTION_BY_ID)}
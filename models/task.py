@@ -1,9 +1,17 @@
 """Task data model for screen automation."""
+import hashlib
 import json
+import os
+import threading
 import uuid
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, field
 from enum import Enum
-from typing import Optional
+from typing import Callable, Optional
+
+try:
+    import orjson
+except ImportError:  # optional faster JSON codec, stdlib json is the fallback
+    orjson = None
 
 
 class TaskType(Enum):
@@ -22,7 +30,26 @@ class ConditionType(Enum):
     OR = "or"     # Any task in group matches
 
 
-@dataclass
+# Enum members by stored value, for from_dict. Unknown values still go
+# through the Enum call so they raise ValueError as before.
+_TASK_TYPE_BY_VALUE = {m.value: m for m in TaskType}
+_ACTION_BY_VALUE = {m.value: m for m in ActionType}
+_CONDITION_BY_VALUE = {m.value: m for m in ConditionType}
+
+# Task fields added after the first release, with the values older
+# configs imply
+_TASK_LEGACY_DEFAULTS = {
+    "search_region": None,
+    "auto_scroll": False,
+    "scroll_region": None,
+    "max_scrolls": 10,
+    "type_text": None,
+    "type_delay": 0.5,
+    "press_enter": True,
+}
+
+
+@dataclass(slots=True)
 class Task:
     """Represents a single automation task."""
     name: str
@@ -57,39 +84,47 @@ class Task:
 
     def to_dict(self) -> dict:
         """Serialize to dictionary."""
-        d = asdict(self)
-        d["task_type"] = self.task_type.value
-        d["action"] = self.action.value
-        # Convert tuples to lists for JSON serialization
-        if d["search_region"] is not None:
-            d["search_region"] = list(d["search_region"])
-        if d["scroll_region"] is not None:
-            d["scroll_region"] = list(d["scroll_region"])
-        return d
+        # Built by hand: every field is a flat value, so asdict's
+        # recursive copy is wasted work. Tuples become lists for JSON.
+        return {
+            "name": self.name,
+            "task_type": self.task_type.value,
+            "action": self.action.value,
+            "template_path": self.template_path,
+            "search_text": self.search_text,
+            "confidence": self.confidence,
+            "enabled": self.enabled,
+            "id": self.id,
+            "cooldown": self.cooldown,
+            "search_region": list(self.search_region) if self.search_region is not None else None,
+            "auto_scroll": self.auto_scroll,
+            "scroll_region": list(self.scroll_region) if self.scroll_region is not None else None,
+            "max_scrolls": self.max_scrolls,
+            "type_text": self.type_text,
+            "type_delay": self.type_delay,
+            "press_enter": self.press_enter,
+        }
 
     @classmethod
     def from_dict(cls, data: dict) -> "Task":
         """Deserialize from dictionary."""
-        data = data.copy()
-        data["task_type"] = TaskType(data["task_type"])
-        data["action"] = ActionType(data["action"])
-        # Handle backward compatibility: add defaults for missing fields
-        data.setdefault("search_region", None)
-        data.setdefault("auto_scroll", False)
-        data.setdefault("scroll_region", None)
-        data.setdefault("max_scrolls", 10)
-        data.setdefault("type_text", None)
-        data.setdefault("type_delay", 0.5)
-        data.setdefault("press_enter", True)
-        # Convert lists back to tuples
-        if data["search_region"] is not None:
-            data["search_region"] = tuple(data["search_region"])
-        if data["scroll_region"] is not None:
-            data["scroll_region"] = tuple(data["scroll_region"])
-        return cls(**data)
+        # Handle backward compatibility: add defaults for missing fields.
+        # Anything to_dict wrote already has them all.
+        if not _TASK_LEGACY_DEFAULTS.keys() <= data.keys():
+            data = {**_TASK_LEGACY_DEFAULTS, **data}
+        search_region = data["search_region"]
+        scroll_region = data["scroll_region"]
+        return cls(**{
+            **data,
+            "task_type": _TASK_TYPE_BY_VALUE.get(data["task_type"]) or TaskType(data["task_type"]),
+            "action": _ACTION_BY_VALUE.get(data["action"]) or ActionType(data["action"]),
+            # Convert lists back to tuples
+            "search_region": tuple(search_region) if search_region is not None else None,
+            "scroll_region": tuple(scroll_region) if scroll_region is not None else None,
+        })
 
 
-@dataclass
+@dataclass(slots=True)
 class MixGroup:
     """A group of tasks evaluated together with AND/OR condition."""
     name: str
@@ -101,43 +136,99 @@ class MixGroup:
     cooldown: float = 3.0
 
     def to_dict(self) -> dict:
-        d = asdict(self)
-        d["condition"] = self.condition.value
-        d["action"] = self.action.value
-        return d
+        return {
+            "name": self.name,
+            "task_ids": list(self.task_ids),
+            "condition": self.condition.value,
+            "action": self.action.value,
+            "enabled": self.enabled,
+            "id": self.id,
+            "cooldown": self.cooldown,
+        }
 
     @classmethod
     def from_dict(cls, data: dict) -> "MixGroup":
         data = data.copy()
-        data["condition"] = ConditionType(data["condition"])
-        data["action"] = ActionType(data["action"])
+        data["condition"] = _CONDITION_BY_VALUE.get(data["condition"]) or ConditionType(data["condition"])
+        data["action"] = _ACTION_BY_VALUE.get(data["action"]) or ActionType(data["action"])
         return cls(**data)
 
 
+def _dumps(data) -> bytes:
+    """Encode data as indented UTF-8 JSON."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
+
+
+def _loads(raw: bytes):
+    # orjson.JSONDecodeError subclasses json.JSONDecodeError
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
 class TaskManager:
     """Manages a collection of tasks and mix groups with persistence."""
 
-    def __init__(self, config_path: str = "config/tasks.json"):
+    # Changes within this many seconds of each other are written once
+    SAVE_DELAY = 0.3
+
+    # Config directories already created by this process
+    _ensured_dirs: set[str] = set()
+
+    def __init__(
+        self,
+        config_path: str = "config/tasks.json",
+        error_callback: Optional[Callable[[str], None]] = None,
+    ):
         self.config_path = config_path
+        # Told about delayed saves that fail, since no caller sees them
+        self.error_callback = error_callback
+        self._save_timer: Optional[threading.Timer] = None
+        self._save_lock = threading.Lock()
+        # Changes not yet written; stays set after a failed write
+        self._dirty = False
+        # Digest of the config file contents as last read or written
+        self._saved_digest: Optional[bytes] = None
         self.tasks: list[Task] = []
         self.mix_groups: list[MixGroup] = []
+        # Indexes kept in step with self.tasks and self.mix_groups
+        self._tasks_by_id: dict[str, Task] = {}
+        self._groups_by_id: dict[str, MixGroup] = {}
+        # Task id -> ids of the mix groups that include it
+        self._groups_containing: dict[str, set[str]] = {}
+
+    def _index_group(self, group: MixGroup):
+        self._groups_by_id[group.id] = group
+        for tid in group.task_ids:
+            self._groups_containing.setdefault(tid, set()).add(group.id)
+
+    def _unindex_group(self, group: MixGroup):
+        self._groups_by_id.pop(group.id, None)
+        for tid in group.task_ids:
+            containing = self._groups_containing.get(tid)
+            if containing is not None:
+                containing.discard(group.id)
+                if not containing:
+                    del self._groups_containing[tid]
 
     def add_task(self, task: Task):
         self.tasks.append(task)
-        self.save()
+        self._tasks_by_id[task.id] = task
+        self._schedule_save()
 
     def remove_task(self, task_id: str):
         self.tasks = [t for t in self.tasks if t.id != task_id]
-        # Also remove from any mix groups
-        for g in self.mix_groups:
+        self._tasks_by_id.pop(task_id, None)
+        # Also remove from the mix groups that include it
+        for gid in self._groups_containing.pop(task_id, ()):
+            g = self._groups_by_id[gid]
             g.task_ids = [tid for tid in g.task_ids if tid != task_id]
-        self.save()
+        self._schedule_save()
 
     def get_task(self, task_id: str) -> Optional[Task]:
-        for t in self.tasks:
-            if t.id == task_id:
-                return t
-        return None
+        return self._tasks_by_id.get(task_id)
 
     def get_active_tasks(self) -> list[Task]:
         return [t for t in self.tasks if t.enabled]
@@ -146,23 +237,24 @@ class TaskManager:
         task = self.get_task(task_id)
         if task:
             task.enabled = not task.enabled
-            self.save()
+            self._schedule_save()
 
     # ── Mix Group Methods ──
 
     def add_mix_group(self, group: MixGroup):
         self.mix_groups.append(group)
-        self.save()
+        self._index_group(group)
+        self._schedule_save()
 
     def remove_mix_group(self, group_id: str):
         self.mix_groups = [g for g in self.mix_groups if g.id != group_id]
-        self.save()
+        group = self._groups_by_id.get(group_id)
+        if group is not None:
+            self._unindex_group(group)
+        self._schedule_save()
 
     def get_mix_group(self, group_id: str) -> Optional[MixGroup]:
-        for g in self.mix_groups:
-            if g.id == group_id:
-                return g
-        return None
+        return self._groups_by_id.get(group_id)
 
     def get_active_mix_groups(self) -> list[MixGroup]:
         return [g for g in self.mix_groups if g.enabled]
@@ -171,27 +263,83 @@ class TaskManager:
         group = self.get_mix_group(group_id)
         if group:
             group.enabled = not group.enabled
-            self.save()
+            self._schedule_save()
+
+    def _schedule_save(self):
+        """Save after SAVE_DELAY, restarting the wait on every change."""
+        with self._save_lock:
+            self._dirty = True
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+            self._save_timer = threading.Timer(self.SAVE_DELAY, self._delayed_save)
+            self._save_timer.daemon = True
+            self._save_timer.start()
+
+    def _delayed_save(self):
+        """Timer callback: flush, reporting failures instead of raising."""
+        try:
+            self.flush()
+        except OSError as e:
+            # The change stays pending, so the next save or flush retries it
+            if self.error_callback:
+                self.error_callback(f"⚠️ 작업 저장 실패: {e}")
+
+    def flush(self):
+        """Write pending changes now. Call before the app exits."""
+        with self._save_lock:
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+                self._save_timer = None
+            if not self._dirty:
+                return
+            self._write()
+            self._dirty = False
 
     def save(self):
         """Save tasks and mix groups to JSON file."""
-        import os
-        os.makedirs(os.path.dirname(self.config_path) or ".", exist_ok=True)
+        with self._save_lock:
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+                self._save_timer = None
+            self._write()
+            self._dirty = False
+
+    def _write(self):
         data = {
             "tasks": [t.to_dict() for t in self.tasks],
             "mix_groups": [g.to_dict() for g in self.mix_groups],
         }
-        with open(self.config_path, "w", encoding="utf-8") as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+        encoded = _dumps(data)
+        # Changes that cancel out (e.g. toggling twice) leave the file as is
+        digest = hashlib.blake2b(encoded, digest_size=16).digest()
+        if digest == self._saved_digest and os.path.exists(self.config_path):
+            return
+        config_dir = os.path.dirname(self.config_path) or "."
+        if config_dir not in self._ensured_dirs:
+            os.makedirs(config_dir, exist_ok=True)
+            self._ensured_dirs.add(config_dir)
+        # Write a temp file and swap it in, so a crash never leaves half a file
+        tmp_path = self.config_path + ".tmp"
+        try:
+            f = open(tmp_path, "wb")
+        except FileNotFoundError:
+            # The directory was removed after it was first created
+            os.makedirs(config_dir, exist_ok=True)
+            f = open(tmp_path, "wb")
+        with f:
+            f.write(encoded)
+        os.replace(tmp_path, self.config_path)
+        self._saved_digest = digest
 
     def load(self):
         """Load tasks and mix groups from JSON file."""
-        import os
         if not os.path.exists(self.config_path):
             return
         try:
-            with open(self.config_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            with open(self.config_path, "rb") as f:
+                raw = f.read()
+            self._saved_digest = hashlib.blake2b(raw, digest_size=16).digest()
+            data = _loads(raw)
             # Support both old format (list) and new format (dict)
             if isinstance(data, list):
                 # Old format: just a list of tasks
@@ -203,3 +351,8 @@ class TaskManager:
         except (json.JSONDecodeError, KeyError, TypeError):
             self.tasks = []
             self.mix_groups = []
+        self._tasks_by_id = {t.id: t for t in self.tasks}
+        self._groups_by_id = {}
+        self._groups_containing = {}
+        for g in self.mix_groups:
+            self._index_group(g)
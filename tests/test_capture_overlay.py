@@ -0,0 +1,33 @@
+"""Conversion of a screen grab region to PIL in the capture overlay."""
+import os
+
+import pytest
+
+pytest.importorskip("PIL")
+QtWidgets = pytest.importorskip("PyQt6.QtWidgets")
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt6.QtCore import QRect
+from PyQt6.QtGui import QColor, QImage
+
+from gui.capture_overlay import _to_pil
+
+
+@pytest.fixture(scope="module", autouse=True)
+def app():
+    return QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+
+
+def test_to_pil_copies_crop_pixels():
+    grab = QImage(50, 40, QImage.Format.Format_RGB32)
+    grab.fill(QColor(12, 34, 56))
+    grab.setPixelColor(10, 5, QColor(200, 100, 50))
+
+    # Odd width, so scanlines carry padding
+    image = _to_pil(grab, QRect(10, 5, 13, 7))
+
+    assert image.mode == "RGB"
+    assert image.size == (13, 7)
+    assert image.getpixel((0, 0)) == (200, 100, 50)
+    assert image.getpixel((12, 6)) == (12, 34, 56)
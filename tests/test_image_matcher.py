@@ -0,0 +1,72 @@
+"""Duplicate suppression in ImageMatcher.find_all_templates."""
+import pytest
+
+np = pytest.importorskip("numpy")
+cv2 = pytest.importorskip("cv2")
+
+from core.frame import Frame
+from core.image_matcher import ImageMatcher
+
+
+def _find_all(tmp_path, screen: np.ndarray, template: np.ndarray):
+    path = str(tmp_path / "template.png")
+    cv2.imwrite(path, template)
+    rgb = np.ascontiguousarray(np.repeat(screen[:, :, None], 3, axis=2))
+    matcher = ImageMatcher()
+    matcher._gpu = False
+    return matcher.find_all_templates(Frame(rgb), path, 0.9)
+
+
+def test_suppress_duplicates_uses_center_distance():
+    xs = np.array([0, 5, 12, 0])
+    ys = np.array([0, 5, 0, 15])
+    scores = np.array([0.99, 0.95, 0.97, 0.96], dtype=np.float32)
+    # (5, 5) is within 10 px of the best hit on both axes; the others are
+    # only offset along one axis and stay separate
+    keep = ImageMatcher._suppress_duplicates(xs, ys, scores)
+    assert sorted(keep.tolist()) == [0, 2, 3]
+
+
+def test_small_template_matches_stay_separate(tmp_path):
+    rng = np.random.default_rng(0)
+    template = rng.integers(0, 256, (8, 8), dtype=np.uint8)
+    screen = np.zeros((60, 80), dtype=np.uint8)
+    screen[20:28, 10:18] = template
+    screen[20:28, 22:30] = template
+
+    assert _find_all(tmp_path, screen, template) == [(14, 24), (26, 24)]
+
+
+def test_large_template_matches_offset_along_one_axis_stay_separate(tmp_path):
+    rng = np.random.default_rng(1)
+    template = rng.integers(0, 256, (200, 200), dtype=np.uint8)
+    screen = np.zeros((240, 460), dtype=np.uint8)
+    screen[20:220, 10:210] = template
+    screen[20:220, 220:420] = template
+
+    assert _find_all(tmp_path, screen, template) == [(110, 120), (320, 120)]
+
+
+def _button(text: str) -> np.ndarray:
+    button = np.full((40, 120), 230, dtype=np.uint8)
+    cv2.rectangle(button, (0, 0), (119, 39), 90, 2)
+    cv2.putText(
+        button, text, (10, 28), cv2.FONT_HERSHEY_SIMPLEX, 0.8, 20, 2, cv2.LINE_AA
+    )
+    return button
+
+
+@pytest.mark.parametrize("dx", range(Frame.PYRAMID_SCALE))
+@pytest.mark.parametrize("dy", range(Frame.PYRAMID_SCALE))
+def test_find_template_is_not_hidden_by_look_alike(tmp_path, dx, dy):
+    template = _button("Confirm")
+    path = str(tmp_path / "template.png")
+    cv2.imwrite(path, template)
+    screen = np.full((600, 800), 200, dtype=np.uint8)
+    screen[100:140, 100:220] = _button("Conform")
+    screen[300 + dy:340 + dy, 400 + dx:520 + dx] = template
+    rgb = np.ascontiguousarray(np.repeat(screen[:, :, None], 3, axis=2))
+    matcher = ImageMatcher()
+    matcher._gpu = False
+
+    assert matcher.find_template(Frame(rgb), path, 0.8) == (460 + dx, 320 + dy)
@@ -0,0 +1,39 @@
+"""Delayed saving in TaskManager."""
+import os
+import shutil
+
+from models.task import ActionType, Task, TaskManager, TaskType
+
+
+def _task() -> Task:
+    return Task(name="t", task_type=TaskType.IMAGE, action=ActionType.CLICK)
+
+
+def test_failed_delayed_save_is_reported_and_retried_on_flush(tmp_path, monkeypatch):
+    errors = []
+    manager = TaskManager(str(tmp_path / "tasks.json"), error_callback=errors.append)
+    manager.add_task(_task())
+
+    def fail(*args, **kwargs):
+        raise PermissionError("read-only")
+
+    monkeypatch.setattr("models.task.open", fail, raising=False)
+    manager._delayed_save()
+    monkeypatch.undo()
+
+    assert len(errors) == 1
+    assert not os.path.exists(manager.config_path)
+    manager.flush()
+    assert os.path.exists(manager.config_path)
+
+
+def test_write_recreates_removed_config_dir(tmp_path):
+    config_dir = tmp_path / "config"
+    manager = TaskManager(str(config_dir / "tasks.json"))
+    manager.add_task(_task())
+    manager.flush()
+
+    shutil.rmtree(config_dir)
+    manager.add_task(_task())
+    manager.flush()
+    assert os.path.exists(manager.config_path)